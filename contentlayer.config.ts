@@ -1,4 +1,5 @@
 import { defineDocumentType, ComputedFields, makeSource } from 'contentlayer2/source-files'
+import { execFileSync } from 'child_process'
 import { writeFileSync } from 'fs'
 import readingTime from 'reading-time'
 import { slug } from 'github-slugger'
@@ -22,7 +23,6 @@ import rehypeKatexNoTranslate from 'rehype-katex-notranslate'
 import rehypeCitation from 'rehype-citation'
 import rehypePrismPlus from 'rehype-prism-plus'
 import siteMetadata from './data/siteMetadata'
-import { allCoreContent, sortPosts } from 'pliny/utils/contentlayer.js'
 import prettier from 'prettier'
 
 const root = process.cwd()
@@ -116,28 +116,15 @@ async function createTagCount(allBlogs) {
   writeFileSync('./app/tag-data.json', defaultFormatted)
 }
 
-function createSearchIndex(allBlogs) {
-  if (
-    siteMetadata?.search?.provider === 'kbar' &&
-    siteMetadata.search.kbarConfig.searchDocumentsPath
-  ) {
-    const basePath = siteMetadata.search.kbarConfig.searchDocumentsPath.replace(
-      /^\${process\.env\.BASE_PATH \|\| ''}\//,
-      ''
-    )
-    const baseName = path.basename(basePath || 'search.json')
-    for (const loc of LOCALES) {
-      const localeBlogs = allBlogs.filter((b) => b.locale === loc)
-      writeFileSync(
-        `public/${baseName.replace('.json', '')}-${loc}.json`,
-        JSON.stringify(allCoreContent(sortPosts(localeBlogs)))
-      )
-    }
-    writeFileSync(
-      'public/search.json',
-      JSON.stringify(allCoreContent(sortPosts(allBlogs)))
-    )
-    console.log('Local search index generated...')
+// Incremental: only MDX files changed since the last run are re-parsed, so this
+// is cheap on every contentlayer rebuild in dev. Provider and file name come
+// from siteMetadata.search, read by the script itself.
+function createSearchIndex() {
+  try {
+    execFileSync('python3', ['scripts/search_index.py'], { stdio: 'inherit' })
+  } catch (error) {
+    if (isProduction) throw error
+    console.warn(`Local search index not updated: ${error.message}`)
   }
 }
 
@@ -242,6 +229,6 @@ export default makeSource({
   onSuccess: async (importData) => {
     const { allBlogs } = await importData()
     createTagCount(allBlogs)
-    createSearchIndex(allBlogs)
+    createSearchIndex()
   },
 })
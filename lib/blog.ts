@@ -1,6 +1,16 @@
 import { allBlogs } from 'contentlayer/generated'
 import { allCoreContent, sortPosts, coreContent } from 'pliny/utils/contentlayer'
 import type { Blog } from 'contentlayer/generated'
+import relatedEn from 'app/related-posts-en.json'
+import relatedDe from 'app/related-posts-de.json'
+import relatedNl from 'app/related-posts-nl.json'
+
+// Top-k related slugs per post, precomputed by scripts/related_posts.py (npm run blog:related)
+const relatedIndex: Record<string, Record<string, string[]>> = {
+  en: relatedEn,
+  de: relatedDe,
+  nl: relatedNl,
+}
 
 function isPostVisible(post: Blog, locale: string, now: Date): boolean {
   if (post.locale !== locale) {
@@ -39,6 +49,17 @@ export function findBlogPost(slug: string, locale: string) {
   return allBlogs.find((b) => b.slug === slug && b.locale === locale)
 }
 
+function scoreByTags(posts: Blog[], tags: string[]): Blog[] {
+  return posts
+    .map((post) => ({ post, score: (post.tags || []).filter((t) => tags.includes(t)).length }))
+    .filter((s) => s.score > 0)
+    .sort(
+      (a, b) =>
+        b.score - a.score || new Date(b.post.date).getTime() - new Date(a.post.date).getTime()
+    )
+    .map((s) => s.post)
+}
+
 export function getRelatedPosts(
   currentSlug: string,
   locale: string,
@@ -50,17 +71,19 @@ export function getRelatedPosts(
     (post) => post.slug !== currentSlug && isPostVisible(post as Blog, locale, now)
   )
 
-  const scored = localePosts.map((post) => {
-    const matchingTags = (post.tags || []).filter((t) => tags.includes(t))
-    return { post, score: matchingTags.length }
-  })
-
-  return scored
-    .filter((s) => s.score > 0)
-    .sort(
-      (a, b) =>
-        b.score - a.score || new Date(b.post.date).getTime() - new Date(a.post.date).getTime()
-    )
+  // Precomputed slugs may point at posts that are not visible (yet), and posts
+  // newer than the index have no entry: fill the remaining slots by shared tags.
+  const bySlug = new Map(localePosts.map((post) => [post.slug, post]))
+  const related = (relatedIndex[locale]?.[currentSlug] || [])
+    .map((slug) => bySlug.get(slug))
+    .filter((post): post is Blog => post !== undefined)
     .slice(0, maxPosts)
-    .map((s) => coreContent(s.post))
+
+  if (related.length < maxPosts) {
+    const chosen = new Set(related.map((post) => post.slug))
+    const rest = localePosts.filter((post) => !chosen.has(post.slug))
+    related.push(...scoreByTags(rest, tags).slice(0, maxPosts - related.length))
+  }
+
+  return related.map((post) => coreContent(post))
 }
@@ -0,0 +1,110 @@
+// Query side of the sharded search index written by scripts/search_shards.py
+// (public/search/{lang}/). A query only finds what the index stored if it is
+// normalized and tokenized the same way, so normalize() mirrors normalize() in
+// that script rule for rule; NORMALIZER_VERSION must match index.json.
+
+export const NORMALIZER_VERSION = 2
+
+export type ShardIndex = {
+  version: number
+  lang: string
+  docs: number
+  prefixLength: number
+  minTokenLength: number
+  stopwords: string[]
+  shards: string[]
+}
+
+export type ShardDoc = {
+  slug: string
+  title: string
+  summary: string
+  date: string
+  tags: string[]
+  image?: string
+}
+
+// token -> [[doc id, weight], ...]; the doc id is the position in docs.json
+export type Shard = Record<string, [number, number][]>
+
+// Built from strings: lookbehind and \p{...} are newer than the ES6 target in tsconfig.json.
+const DE_DIGRAPH_RE = new RegExp('(?<![aeiq])(ae|oe|ue)', 'g')
+const MARK_RE = new RegExp('\\p{M}', 'gu')
+const TOKEN_RE = /[0-9a-z]+/g
+
+export function normalize(text: string, lang: string): string {
+  // Python's casefold(): lower case, and ß -> ss.
+  let folded = text.toLowerCase().replace(/ß/g, 'ss')
+  if (lang === 'de') {
+    folded = folded
+      .replace(/ä/g, 'a')
+      .replace(/ö/g, 'o')
+      .replace(/ü/g, 'u')
+      .replace(DE_DIGRAPH_RE, (digraph) => digraph[0])
+  } else if (lang === 'nl') {
+    folded = folded.replace(/ĳ/g, 'ij')
+  }
+  // Drop combining marks (é -> e) after compatibility decomposition.
+  return folded.normalize('NFKD').replace(MARK_RE, '')
+}
+
+export function tokenize(text: string, index: ShardIndex): string[] {
+  const stopwords = new Set(index.stopwords)
+  return (normalize(text, index.lang).match(TOKEN_RE) || []).filter(
+    (token) => token.length >= index.minTokenLength && !stopwords.has(token)
+  )
+}
+
+export function shardKey(token: string, index: ShardIndex): string {
+  return token.slice(0, index.prefixLength)
+}
+
+// Doc ids matching every query token as a prefix, best first (summed field
+// weights, then doc id), like sharded_query() in scripts/search_shards.py.
+export async function searchShards(
+  query: string,
+  index: ShardIndex,
+  loadShard: (key: string) => Promise<Shard>
+): Promise<number[]> {
+  let scores: Map<number, number> | null = null
+  for (const token of tokenize(query, index)) {
+    const key = shardKey(token, index)
+    const shard = index.shards.includes(key) ? await loadShard(key) : {}
+    const tokenScores = new Map<number, number>()
+    for (const [term, postings] of Object.entries(shard)) {
+      if (!term.startsWith(token)) continue
+      for (const [doc, weight] of postings) {
+        tokenScores.set(doc, (tokenScores.get(doc) || 0) + weight)
+      }
+    }
+    if (scores === null) {
+      scores = tokenScores
+    } else {
+      const both = new Map<number, number>()
+      for (const [doc, score] of scores) {
+        if (tokenScores.has(doc)) both.set(doc, score + tokenScores.get(doc))
+      }
+      scores = both
+    }
+  }
+  if (!scores) return []
+  return [...scores.keys()].sort((a, b) => scores.get(b) - scores.get(a) || a - b)
+}
+
+// Loads index.json and docs.json of one locale and returns a query function
+// that fetches (and caches) only the shards a query touches.
+export async function loadShardedSearch(lang: string, basePath: string = '') {
+  const root = `${basePath}/search/${lang}`
+  const fetchJson = async (path: string) => (await fetch(`${root}/${path}`)).json()
+  const index: ShardIndex = await fetchJson('index.json')
+  if (index.version !== NORMALIZER_VERSION) {
+    throw new Error(`search/${lang}: normalizer v${index.version}, client expects v${NORMALIZER_VERSION}`)
+  }
+  const docs: ShardDoc[] = await fetchJson('docs.json')
+  const shards = new Map<string, Promise<Shard>>()
+  const loadShard = (key: string) => {
+    if (!shards.has(key)) shards.set(key, fetchJson(`shards/${encodeURIComponent(key)}.json`))
+    return shards.get(key)
+  }
+  return async (query: string) => (await searchShards(query, index, loadShard)).map((id) => docs[id])
+}
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the Python content pipeline on synthetic corpora.
+
+For each corpus size (articles per locale) a deterministic corpus is written to
+.cache/bench/<size>/: EN articles plus DE/NL translation bundles in the
+data/translations layout, with the front matter shape write_mdx used (title,
+date, summary, tags, authors, layout, images, keywords). Then every stage runs
+on it in a fresh process:
+
+    generate      translations.py renders DE/NL into blog/ (cold)
+    regenerate    the same again; nothing should be written
+    validate      validate_blog.py over all locales
+    images        blog_images.py on a fixed pool of sources (needs Pillow)
+    search-index  search_index.py, cold
+    search-shards search_shards.py
+    related       related_posts.py, full run (needs NumPy/SciPy)
+    feeds         feeds.py (RSS, tag feeds, sitemaps)
+    consistency   blog_consistency.py, cold cache
+
+Per stage the report records wall time, peak RSS of the stage process and its
+workers, and the files/bytes it wrote (from a before/after snapshot of the
+corpus directory). The report goes to .cache/bench/report.json. If a baseline
+exists, every stage is compared with it, and the run fails when wall time or
+peak RSS grows past --threshold. contentlayer and next build are not covered.
+
+--profile writes cProfile stats per selected stage. cProfile only sees the
+stage process, so validate and images then run without their process pool;
+their wall times are single-core figures in a profiled report.
+
+Usage:
+    python3 scripts/bench_pipeline.py
+    python3 scripts/bench_pipeline.py --size 100,1k,10k --save-baseline
+    python3 scripts/bench_pipeline.py --stage validate,search-index --profile
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import cProfile
+import datetime as dt
+import io
+import json
+import multiprocessing
+import os
+import pathlib
+import platform
+import random
+import resource
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import translations
+from blog_mdx import LOCALES, render, split_list
+from blog_writer import ROOT, MdxWriter, load_json, write_if_changed
+
+BENCH_DIR = ROOT / ".cache" / "bench"
+REPORT_PATH = BENCH_DIR / "report.json"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+REPORT_VERSION = 1
+
+SIZES = (100, 1000)
+THRESHOLD = 0.25
+MIN_DELTA_MS = 25.0
+MIN_DELTA_KB = 8 * 1024
+SEED = 2026
+IMAGE_POOL = 12
+
+VOCAB = {
+    "en": "market inflation rates bitcoin euro policy growth investors portfolio risk yield outlook liquidity"
+    " savings pension equities bonds volatility support resistance allocation forecast demand supply".split(),
+    "de": "Markt Inflation Zinsen Bitcoin Euro Geldpolitik Wachstum Anleger Portfolio Risiko Rendite Ausblick"
+    " Liquidität Sparen Rente Aktien Anleihen Volatilität Unterstützung Widerstand Allokation Prognose".split(),
+    "nl": "markt inflatie rente bitcoin euro beleid groei beleggers portefeuille risico rendement vooruitzicht"
+    " liquiditeit sparen pensioen aandelen obligaties volatiliteit steun weerstand allocatie prognose".split(),
+}
+TAGS = {
+    "en": ["Bitcoin", "Crypto", "ECB", "Europe", "Trading Strategy", "Gold", "Savings", "DAX", "2026"],
+    "de": ["Bitcoin", "Krypto", "EZB", "Europa", "Handelsstrategie", "Gold", "Sparen", "DAX", "2026"],
+    "nl": ["Bitcoin", "Crypto", "ECB", "Europa", "Handelsstrategie", "Goud", "Sparen", "AEX", "2026"],
+}
+KEYWORDS = ["ECB interest rates 2026", "eurozone inflation 1.9%", "Bitcoin quantum threat", "EZB Zinssätze 2026"]
+DATA_SOURCE = {"en": "Data source", "de": "Datenquelle", "nl": "Gegevensbron"}
+
+
+@dataclass
+class Corpus:
+    root: pathlib.Path
+
+    @property
+    def base(self) -> pathlib.Path:
+        return self.root / "blog"
+
+    @property
+    def source(self) -> pathlib.Path:
+        return self.root / "translations"
+
+    @property
+    def public(self) -> pathlib.Path:
+        return self.root / "public"
+
+    @property
+    def cache(self) -> pathlib.Path:
+        return self.root / "cache"
+
+
+class StageSkipped(Exception):
+    pass
+
+
+# --- corpus ------------------------------------------------------------------------
+
+
+def _sentence(rng: random.Random, lang: str, words: int) -> str:
+    text = " ".join(rng.choice(VOCAB[lang]) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, lang: str) -> str:
+    return " ".join(_sentence(rng, lang, rng.randint(10, 18)) for _ in range(rng.randint(4, 6)))
+
+
+def _body(rng: random.Random, lang: str, slug: str) -> str:
+    blocks = [_paragraph(rng, lang)]
+    for section in range(rng.randint(4, 6)):
+        blocks.append(f"## {_sentence(rng, lang, 4)[:-1]}")
+        blocks += [_paragraph(rng, lang), _paragraph(rng, lang)]
+        if section == 1:
+            blocks.append(f"![{_sentence(rng, lang, 5)[:-1]}](/static/images/blog/{slug}-chart.webp)")
+            blocks.append(f"*{DATA_SOURCE[lang]}: ECB, 2026.*")
+    return "\n\n".join(blocks) + "\n"
+
+
+def _front_matter(rng: random.Random, lang: str) -> dict:
+    return {
+        "title": _sentence(rng, lang, rng.randint(6, 10))[:-1],
+        "summary": _sentence(rng, lang, rng.randint(18, 24)),
+        "tags": rng.sample(TAGS[lang], rng.randint(2, 4)),
+    }
+
+
+def synthesize(corpus: Corpus, size: int, seed: int = SEED) -> None:
+    """Write `size` EN articles and `size` DE/NL translation bundles."""
+    shutil.rmtree(corpus.root, ignore_errors=True)
+    rng = random.Random(seed)
+    for index in range(size):
+        slug = f"article-{index:05d}"
+        meta = {
+            "date": dt.date(2025, 1 + index % 12, 1 + index % 28),
+            "images": [f"/static/images/blog/pool-{index % IMAGE_POOL:02d}-hero.png"],
+            "keywords": rng.sample(KEYWORDS, 3),
+        }
+        en = {**_front_matter(rng, "en"), **translations.DEFAULTS, **meta}
+        path = corpus.base / "en" / f"{slug}.mdx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(render(en, _body(rng, "en", slug)), "utf-8")
+
+        bundle = corpus.source / slug
+        bundle.mkdir(parents=True, exist_ok=True)
+        meta_lines = [f"date: {meta['date'].isoformat()}", "images:", f"  - {meta['images'][0]}", "keywords:"]
+        meta_lines += [f"  - {k}" for k in meta["keywords"]]
+        (bundle / translations.META_FILE).write_text("\n".join(meta_lines) + "\n", "utf-8")
+        for lang in LOCALES[1:]:
+            (bundle / f"{lang}.mdx").write_text(render(_front_matter(rng, lang), _body(rng, lang, slug)), "utf-8")
+
+    from blog_images import IMAGE_PREFIX, Image
+
+    if Image is not None:
+        out = corpus.public / IMAGE_PREFIX.strip("/")
+        out.mkdir(parents=True, exist_ok=True)
+        for i in range(IMAGE_POOL):
+            img = Image.new("RGB", (1600, 900), (20 * i % 255, 120, 200 - 10 * i))
+            img.save(out / f"pool-{i:02d}-hero.png")
+
+
+# --- stages ------------------------------------------------------------------------
+# Each stage imports its module itself, so a stage process only pays for what it
+# uses (NumPy alone would add ~40 MiB to every peak RSS figure). `jobs` caps the
+# process pools of validate and images; the other stages run in one process.
+
+
+def stage_generate(corpus: Corpus, jobs: int | None = None) -> dict:
+    with MdxWriter(corpus.cache / "mdx-manifest.json", corpus.root, verbose=False) as writer:
+        count, _ = translations.generate(writer, corpus.source, corpus.base, validate="off")
+    return {"documents": count, "mdx_written": writer.stats.written}
+
+
+def stage_validate(corpus: Corpus, jobs: int | None = None) -> dict:
+    import validate_blog
+
+    summary = validate_blog.validate_tree(corpus.base, jobs=jobs)["summary"]
+    return {"files": summary["total"], "jobs": summary["jobs"]}
+
+
+def stage_images(corpus: Corpus, jobs: int | None = None) -> dict:
+    import blog_images
+
+    if blog_images.Image is None:
+        raise StageSkipped("Pillow not installed")
+    sources = blog_images.referenced_images(corpus.base)
+    summary = blog_images.run(sources, corpus.public, corpus.cache / "image-variants.json", jobs=jobs)
+    return {
+        "encoded": summary["encoded"],
+        "missing": len(summary["missing"]),
+        "failed": len(summary["failed"]),
+        "jobs": summary["jobs"],
+    }
+
+
+def stage_search_index(corpus: Corpus, jobs: int | None = None) -> dict:
+    import search_index
+
+    stats = search_index.build(corpus.base, corpus.public, cache_path=corpus.cache / "search-fingerprints.json")
+    return {"parsed": stats.parsed}
+
+
+def stage_search_shards(corpus: Corpus, jobs: int | None = None) -> dict:
+    import search_shards
+
+    shards = 0
+    for lang in LOCALES:
+        docs, built = search_shards.build_locale(lang, corpus.base)
+        search_shards.write_locale(lang, docs, built, corpus.public / "search")
+        shards += len(built)
+    return {"shards": shards}
+
+
+def stage_related(corpus: Corpus, jobs: int | None = None) -> dict:
+    import related_posts
+
+    if related_posts.np is None:
+        raise StageSkipped("NumPy/SciPy not installed")
+    rows = 0
+    for lang in LOCALES:
+        docs = related_posts.load_corpus(lang, corpus.base)
+        related, recomputed, _ = related_posts.update_locale(lang, docs, {}, {})
+        path = corpus.public / f"{related_posts.OUT_NAME}-{lang}.json"
+        write_if_changed(path, json.dumps(related, ensure_ascii=False, indent=2).encode("utf-8"))
+        rows += recomputed
+    return {"rows": rows}
+
+
+def stage_feeds(corpus: Corpus, jobs: int | None = None) -> dict:
+    import feeds
+
+    stats = feeds.generate(corpus.base, corpus.public)
+    return {"urls": stats["urls"]}
+
+
+def stage_consistency(corpus: Corpus, jobs: int | None = None) -> dict:
+    import blog_consistency
+
+    graph, errors, _ = blog_consistency.build_graph(corpus.base, corpus.cache / "consistency-facts.json")
+    issues = blog_consistency.check(graph, blog_consistency.public_images(corpus.public))
+    return {"slugs": len(graph), "issues": sum(map(len, issues.values())) + len(errors)}
+
+
+STAGES = {
+    "generate": stage_generate,
+    "regenerate": stage_generate,
+    "validate": stage_validate,
+    "images": stage_images,
+    "search-index": stage_search_index,
+    "search-shards": stage_search_shards,
+    "related": stage_related,
+    "feeds": stage_feeds,
+    "consistency": stage_consistency,
+}
+
+
+def _snapshot(root: pathlib.Path) -> dict[str, tuple[int, int]]:
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(dirpath, name))
+            files[os.path.join(dirpath, name)] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def run_stage(name: str, root: str, profile_path: str | None = None) -> dict:
+    """Pool worker: run one stage in a fresh process and measure it.
+
+    With a profile_path the stage runs without worker processes: cProfile only
+    sees this process, and a pooled stage would profile as time in pool.map.
+    """
+    corpus = Corpus(pathlib.Path(root))
+    jobs = 1 if profile_path else None
+    before = _snapshot(corpus.root)
+    profiler = cProfile.Profile() if profile_path else None
+    started = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        try:
+            # Per-file progress lines from the stage scripts are not part of the report.
+            with contextlib.redirect_stdout(io.StringIO()):
+                extra = STAGES[name](corpus, jobs)
+        finally:
+            if profiler:
+                profiler.disable()
+    except StageSkipped as exc:
+        return {"skipped": str(exc)}
+    wall_ms = (time.perf_counter() - started) * 1000
+    after = _snapshot(corpus.root)
+    changed = [path for path, sig in after.items() if before.get(path) != sig]
+    # ru_maxrss is in KiB on Linux; RUSAGE_CHILDREN covers process-pool workers.
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    result = {
+        "wall_ms": round(wall_ms, 1),
+        "peak_rss_kb": peak,
+        "files_written": len(changed),
+        "bytes_written": sum(after[path][0] for path in changed),
+        **extra,
+    }
+    if profiler:
+        profiler.dump_stats(profile_path)
+        result["profile"] = profile_path
+    return result
+
+
+# --- baseline ------------------------------------------------------------------------
+
+
+def compare(report: dict, baseline: dict, threshold: float = THRESHOLD) -> list[str]:
+    """Regression messages for every stage that got slower or bigger than allowed."""
+    regressions = []
+    for size, stages in report["sizes"].items():
+        for name, current in stages.items():
+            previous = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not previous or "skipped" in current or "skipped" in previous:
+                continue
+            for metric, slack in (("wall_ms", MIN_DELTA_MS), ("peak_rss_kb", MIN_DELTA_KB)):
+                old, new = previous[metric], current[metric]
+                if new > old * (1 + threshold) and new - old > slack:
+                    regressions.append(f"{size}/{name}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    return int(float(value[:-1]) * 1000) if value.endswith("k") else int(value)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", "-s", action="append", help="articles per locale, e.g. 100,1k,10k (default 100,1k)")
+    parser.add_argument("--stage", action="append", help=f"only these stages ({', '.join(STAGES)})")
+    parser.add_argument("--workdir", type=pathlib.Path, default=BENCH_DIR, help="corpus directory (default .cache/bench)")
+    parser.add_argument("--output", "-o", type=pathlib.Path, default=REPORT_PATH, help="JSON report path")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH, help="baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed growth, 0.25 = 25%% (default)")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="dump cProfile stats for the selected stages next to the report (pooled stages run on one core)",
+    )
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic corpora afterwards")
+    args = parser.parse_args(argv)
+    try:
+        args.size = [parse_size(v) for v in split_list(args.size)] or list(SIZES)
+    except ValueError as exc:
+        parser.error(f"invalid --size: {exc}")
+    args.stage = split_list(args.stage) or list(STAGES)
+    unknown = [s for s in args.stage if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    if "regenerate" in args.stage and "generate" not in args.stage:
+        parser.error("regenerate needs the generate stage")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    # Stages after "generate" need the DE/NL files even when it is not measured.
+    stages = list(args.stage) if "generate" in args.stage else ["generate", *args.stage]
+    report = {
+        "version": REPORT_VERSION,
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "profiled": args.profile,
+        "sizes": {},
+    }
+    if args.profile:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+    context = multiprocessing.get_context("spawn")
+    for size in args.size:
+        corpus = Corpus(args.workdir / str(size))
+        started = time.perf_counter()
+        synthesize(corpus, size)
+        print(f"corpus {size}/locale: synthesized in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+        results = {}
+        for name in stages:
+            profiled = args.profile and name in args.stage
+            profile_path = str(args.output.parent / f"profile-{size}-{name}.pstats") if profiled else None
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(run_stage, name, str(corpus.root), profile_path).result()
+            if name in args.stage:
+                results[name] = result
+            if "skipped" in result:
+                print(f"  {name:<14} skipped: {result['skipped']}", file=sys.stderr)
+            else:
+                print(
+                    f"  {name:<14} {result['wall_ms']:>10.1f} ms {result['peak_rss_kb'] / 1024:>8.1f} MiB "
+                    f"{result['files_written']:>7} files {result['bytes_written'] / 1024:>10.1f} KiB",
+                    file=sys.stderr,
+                )
+        report["sizes"][str(size)] = results
+        if not args.keep:
+            shutil.rmtree(corpus.root, ignore_errors=True)
+
+    data = (json.dumps(report, indent=2) + "\n").encode("utf-8")
+    write_if_changed(args.output, data)
+    print(f"Report: {args.output}", file=sys.stderr)
+    if args.save_baseline:
+        write_if_changed(args.baseline, data)
+        print(f"Baseline saved: {args.baseline}", file=sys.stderr)
+        return 0
+    if args.profile:
+        print("Profiled run, baseline comparison skipped (python3 -m pstats <file> to inspect).", file=sys.stderr)
+        return 0
+    baseline = load_json(args.baseline, None, REPORT_VERSION)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.", file=sys.stderr)
+        return 0
+    regressions = compare(report, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Cross-locale consistency check for data/blog/{en,de,nl}.
+
+Streams every article once and builds an in-memory slug -> locale -> assets
+graph, then reports:
+
+    missing       slug exists in some locales but not in others
+    orphaned      DE/NL article without an EN original
+    mismatch      shared front matter (date, layout, images, keywords) differs
+                  from the EN version
+    dangling      /static/images/blog/... referenced in front matter or body
+                  but not present in public/
+    unused        file in public/static/images/blog referenced by no article
+
+Per-file facts are cached in .cache/consistency-facts.json keyed by size and
+mtime, so a pre-commit run only re-parses the files that changed.
+
+Usage:
+    python3 scripts/blog_consistency.py
+    python3 scripts/blog_consistency.py --json
+    python3 scripts/blog_consistency.py --check missing,mismatch,dangling
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import sys
+import time
+from collections import defaultdict
+
+from blog_mdx import LOCALES, MARKDOWN_IMAGE_RE, FrontMatterError, iter_paths, parse, split_list
+from blog_writer import BASE, ROOT, load_json, write_if_changed
+
+PUBLIC_DIR = ROOT / "public"
+IMAGE_PREFIX = "/static/images/blog/"
+IGNORED_IMAGE_DIRS = ("_v",)
+CACHE_PATH = ROOT / ".cache" / "consistency-facts.json"
+CACHE_VERSION = 1
+
+SOURCE_LANG = "en"
+SHARED_FIELDS = ("date", "layout", "images", "keywords")
+CHECKS = ("missing", "orphaned", "mismatch", "dangling", "unused")
+
+
+def extract_facts(text: str) -> dict:
+    """The parts of an article the graph needs; everything else is discarded."""
+    front_matter, body = parse(text)
+    facts = {}
+    for field in SHARED_FIELDS:
+        value = front_matter.get(field)
+        if isinstance(value, list):
+            value = [str(v) for v in value]
+        elif value is not None:
+            value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+        facts[field] = value
+    facts["refs"] = sorted(set(MARKDOWN_IMAGE_RE.findall(body)))
+    return facts
+
+
+def build_graph(base: pathlib.Path = BASE, cache_path: pathlib.Path | None = CACHE_PATH) -> tuple[dict, dict, dict]:
+    """One pass over the corpus.
+
+    Returns (graph, errors, stats): graph maps slug -> lang -> facts, errors
+    maps file -> parse error.
+    """
+    cache = load_json(cache_path, {}, CACHE_VERSION).get("files", {}) if cache_path else {}
+    fresh = {}
+    graph: dict[str, dict[str, dict]] = defaultdict(dict)
+    errors = {}
+    stats = {"files": 0, "parsed": 0, "cached": 0}
+    for lang, path in iter_paths(base, LOCALES):
+        key = f"{lang}/{path.name}"
+        st = path.stat()
+        entry = cache.get(key)
+        stats["files"] += 1
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            stats["cached"] += 1
+        else:
+            try:
+                facts = extract_facts(path.read_text(encoding="utf-8"))
+            except FrontMatterError as exc:
+                errors[key] = str(exc)
+                continue
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "facts": facts}
+            stats["parsed"] += 1
+        fresh[key] = entry
+        graph[path.stem][lang] = entry["facts"]
+    if cache_path:
+        payload = {"version": CACHE_VERSION, "files": dict(sorted(fresh.items()))}
+        write_if_changed(cache_path, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    return graph, errors, stats
+
+
+def public_images(public: pathlib.Path = PUBLIC_DIR) -> set[str]:
+    """Every file under public/static/images/blog as a site path (variants excluded)."""
+    root = public / IMAGE_PREFIX.strip("/")
+    found = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORED_IMAGE_DIRS]
+        rel = pathlib.Path(dirpath).relative_to(root).as_posix()
+        prefix = IMAGE_PREFIX if rel == "." else f"{IMAGE_PREFIX}{rel}/"
+        found.update(prefix + name for name in filenames if not name.startswith("."))
+    return found
+
+
+def check(graph: dict, images_on_disk: set[str], checks=CHECKS) -> dict[str, list[dict]]:
+    issues: dict[str, list[dict]] = {name: [] for name in checks}
+    referenced: dict[str, set[str]] = defaultdict(set)
+    for slug in sorted(graph):
+        locales = graph[slug]
+        for lang, facts in locales.items():
+            for src in (facts.get("images") or []) + facts["refs"]:
+                if src.startswith(IMAGE_PREFIX):
+                    referenced[src].add(f"{lang}/{slug}")
+
+        if "missing" in issues:
+            absent = [l for l in LOCALES if l not in locales]
+            if absent and SOURCE_LANG in locales:
+                issues["missing"].append({"slug": slug, "missing": absent})
+        if "orphaned" in issues and SOURCE_LANG not in locales:
+            issues["orphaned"].append({"slug": slug, "locales": sorted(locales)})
+        if "mismatch" in issues and SOURCE_LANG in locales:
+            source = locales[SOURCE_LANG]
+            for lang in sorted(locales):
+                if lang == SOURCE_LANG:
+                    continue
+                for field in SHARED_FIELDS:
+                    if locales[lang].get(field) != source.get(field):
+                        issues["mismatch"].append(
+                            {
+                                "slug": slug,
+                                "lang": lang,
+                                "field": field,
+                                SOURCE_LANG: source.get(field),
+                                "value": locales[lang].get(field),
+                            }
+                        )
+
+    if "dangling" in issues:
+        for src in sorted(referenced):
+            if src not in images_on_disk:
+                issues["dangling"].append({"src": src, "referencedBy": sorted(referenced[src])})
+    if "unused" in issues:
+        issues["unused"] = [{"src": src} for src in sorted(images_on_disk - referenced.keys())]
+    return issues
+
+
+def _describe(kind: str, issue: dict) -> str:
+    if kind == "missing":
+        return f"{issue['slug']}: no {', '.join(issue['missing'])} translation"
+    if kind == "orphaned":
+        return f"{issue['slug']}: {', '.join(issue['locales'])} without {SOURCE_LANG} original"
+    if kind == "mismatch":
+        return f"{issue['lang']}/{issue['slug']}: {issue['field']} {issue['value']!r} != {SOURCE_LANG} {issue[SOURCE_LANG]!r}"
+    if kind == "dangling":
+        refs = issue["referencedBy"]
+        more = f" (+{len(refs) - 3} more)" if len(refs) > 3 else ""
+        return f"{issue['src']} <- {', '.join(refs[:3])}{more}"
+    return issue["src"]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--public", type=pathlib.Path, default=PUBLIC_DIR, help="public directory (default public)")
+    parser.add_argument("--check", "-c", action="append", help=f"only these checks ({', '.join(CHECKS)})")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="parse every file and leave the cache alone")
+    args = parser.parse_args(argv)
+    args.check = split_list(args.check) or list(CHECKS)
+    unknown = [c for c in args.check if c not in CHECKS]
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    graph, errors, stats = build_graph(args.base, None if args.no_cache else CACHE_PATH)
+    images = public_images(args.public) if {"dangling", "unused"} & set(args.check) else set()
+    issues = check(graph, images, args.check)
+    stats["slugs"] = len(graph)
+    stats["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    total = sum(len(v) for v in issues.values()) + len(errors)
+
+    if args.json:
+        print(json.dumps({"stats": stats, "errors": errors, "issues": issues}, ensure_ascii=False, indent=2))
+    else:
+        for key, message in errors.items():
+            print(f"[error] {key}: {message}")
+        for kind, found in issues.items():
+            if found:
+                print(f"\n{kind} ({len(found)}):")
+                for issue in found:
+                    print(f"  - {_describe(kind, issue)}")
+        print(
+            f"\n{stats['slugs']} slugs, {stats['files']} files ({stats['parsed']} parsed, "
+            f"{stats['cached']} cached) in {stats['ms']} ms: {total} issue(s)."
+        )
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
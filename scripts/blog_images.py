@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Content-addressed blog image stage with responsive variants.
+
+Successor of optimize-blog-images.mjs that never touches the originals:
+
+- Inputs are the /static/images/blog/... paths referenced by articles
+  (front matter `images:` and markdown images in the body).
+- Each source is decoded once. Hero images are fitted to 1200x675 and charts
+  to 800x600 (same letterbox as the .mjs); other figures keep their aspect
+  ratio. Width variants (400/800/1200, capped at the base width) are then
+  encoded to WebP. A binary search over quality in [60, 82] finds the highest
+  quality that stays under the size target, instead of stepping down by 4.
+- Outputs are keyed by source hash + target size + quality settings and land in
+  public/static/images/blog/_v/. A key already in the manifest with its files
+  present is a cache hit and costs one hash, no decode.
+- Sources fan out across all cores (process pool). A source that cannot be
+  decoded is reported like a missing one and left out of the manifest.
+
+Manifest for layouts: data/image-variants.json, mapping the original path to
+{width, height, quality, variants: [{width, height, src, bytes}]}.
+
+Not part of the build (it needs Pillow and a cold run takes about a minute).
+Like the originals, the variants and the manifest are committed: run
+`npm run blog:images` after adding or changing blog images and commit
+public/static/images/blog/_v/ together with data/image-variants.json. File
+names are content-addressed, so unchanged images never churn, and --prune
+keeps _v/ to exactly what the manifest lists.
+
+Requires Pillow (pip install pillow).
+
+Usage:
+    python3 scripts/blog_images.py
+    python3 scripts/blog_images.py --jobs 4 --prune
+    python3 scripts/blog_images.py --force         # ignore the cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import pathlib
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from blog_mdx import LOCALES, MARKDOWN_IMAGE_RE, iter_documents
+from blog_writer import BASE, ROOT, atomic_write_bytes, load_json, write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:  # reported in main() so --help still works
+    Image = None
+
+PUBLIC_DIR = ROOT / "public"
+IMAGE_PREFIX = "/static/images/blog/"
+VARIANT_DIR = "_v"
+MANIFEST_PATH = ROOT / "data" / "image-variants.json"
+MANIFEST_VERSION = 1
+
+HERO_SIZE = (1200, 675)
+CHART_SIZE = (800, 600)
+MAX_WIDTH = 1200
+WIDTHS = (400, 800, 1200)
+BACKGROUND = (240, 244, 248)
+TARGET_KB = 80
+QUALITY_MIN = 60
+QUALITY_MAX = 82
+WEBP_METHOD = 6
+
+
+def is_hero(name: str) -> bool:
+    return "-hero." in name
+
+
+def is_chart(name: str) -> bool:
+    return bool(re.search(r"-chart\d*\.", name)) or ("-chart" in name and "-hero" not in name)
+
+
+def referenced_images(base: pathlib.Path = BASE, langs=LOCALES) -> list[str]:
+    """Unique /static/images/blog/... paths referenced by any article, sorted."""
+    found = set()
+    for doc in iter_documents(base, langs):
+        for src in doc.front_matter.get("images") or []:
+            found.add(str(src))
+        found.update(MARKDOWN_IMAGE_RE.findall(doc.body))
+    return sorted(s for s in found if s.startswith(IMAGE_PREFIX) and "/_v/" not in s)
+
+
+def target_size(name: str) -> tuple[int, int] | None:
+    """Letterbox size for heroes and charts; None keeps the source aspect ratio."""
+    if is_hero(name):
+        return HERO_SIZE
+    if is_chart(name):
+        return CHART_SIZE
+    return None
+
+
+def cache_key(source_hash: str, name: str) -> str:
+    spec = f"{target_size(name)}|{WIDTHS}|{TARGET_KB}|{QUALITY_MIN}-{QUALITY_MAX}|m{WEBP_METHOD}"
+    return hashlib.sha256(f"{source_hash}|{spec}".encode()).hexdigest()[:16]
+
+
+def _encode(img, quality: int) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=quality, method=WEBP_METHOD)
+    return buf.getvalue()
+
+
+def encode_under_target(img, target_bytes: int) -> tuple[bytes, int]:
+    """Highest quality in [QUALITY_MIN, QUALITY_MAX] whose output fits target_bytes.
+
+    Tries QUALITY_MAX first (small variants usually fit straight away), then
+    binary-searches; falls back to QUALITY_MIN when nothing fits.
+    """
+    best = _encode(img, QUALITY_MAX)
+    if len(best) <= target_bytes:
+        return best, QUALITY_MAX
+    lo, hi = QUALITY_MIN, QUALITY_MAX - 1
+    best_q = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        data = _encode(img, mid)
+        if len(data) <= target_bytes:
+            best, best_q = data, mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best_q is None:
+        return _encode(img, QUALITY_MIN), QUALITY_MIN
+    return best, best_q
+
+
+def _base_canvas(src, name: str):
+    size = target_size(name)
+    if size is None:
+        if src.width > MAX_WIDTH:
+            return src.resize((MAX_WIDTH, round(src.height * MAX_WIDTH / src.width)), Image.LANCZOS)
+        return src
+    # fit: 'contain', position: 'center' on the PRD background colour.
+    scale = min(size[0] / src.width, size[1] / src.height)
+    fitted = src.resize((max(1, round(src.width * scale)), max(1, round(src.height * scale))), Image.LANCZOS)
+    canvas = Image.new("RGB", size, BACKGROUND)
+    canvas.paste(fitted, ((size[0] - fitted.width) // 2, (size[1] - fitted.height) // 2))
+    return canvas
+
+
+def process_image(src_path: str, key: str, out_dir: str) -> dict:
+    """Pool worker: decode once, emit every width variant. Returns a manifest entry."""
+    t0 = time.perf_counter()
+    path = pathlib.Path(src_path)
+    stem = path.stem
+    with Image.open(path) as opened:
+        src = opened.convert("RGB")
+    canvas = _base_canvas(src, path.name)
+    widths = sorted({w for w in WIDTHS if w < canvas.width} | {canvas.width})
+    variants = []
+    qualities = []
+    for width in widths:
+        img = canvas if width == canvas.width else canvas.resize(
+            (width, round(canvas.height * width / canvas.width)), Image.LANCZOS
+        )
+        data, quality = encode_under_target(img, TARGET_KB * 1024)
+        name = f"{stem}-{width}w-{key}.webp"
+        atomic_write_bytes(pathlib.Path(out_dir) / name, data)
+        variants.append(
+            {"width": img.width, "height": img.height, "src": f"{IMAGE_PREFIX}{VARIANT_DIR}/{name}", "bytes": len(data)}
+        )
+        qualities.append(quality)
+    return {
+        "key": key,
+        "width": canvas.width,
+        "height": canvas.height,
+        "quality": min(qualities),
+        "variants": variants,
+        "ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+
+def _process_or_error(src_path: str, key: str, out_dir: str) -> dict:
+    """process_image(), but a source that fails to decode or encode yields {"error": ...}."""
+    try:
+        return process_image(src_path, key, out_dir)
+    except Exception as exc:  # one bad file must not cost the whole run its manifest
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def _hit(entry: dict | None, key: str, public: pathlib.Path) -> bool:
+    if not entry or entry.get("key") != key:
+        return False
+    return all((public / v["src"].lstrip("/")).is_file() for v in entry["variants"])
+
+
+def run(
+    sources: list[str],
+    public: pathlib.Path = PUBLIC_DIR,
+    manifest_path: pathlib.Path = MANIFEST_PATH,
+    jobs: int | None = None,
+    force: bool = False,
+    prune: bool = False,
+) -> dict:
+    previous = {} if force else load_json(manifest_path, {}, MANIFEST_VERSION).get("images", {})
+    out_dir = public / IMAGE_PREFIX.strip("/") / VARIANT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    images: dict[str, dict] = {}
+    todo: list[tuple[str, str, str]] = []
+    missing = []
+    for src in sources:
+        path = public / src.lstrip("/")
+        if not path.is_file():
+            missing.append(src)
+            continue
+        key = cache_key(hashlib.sha256(path.read_bytes()).hexdigest(), path.name)
+        if _hit(previous.get(src), key, public):
+            images[src] = previous[src]
+        else:
+            todo.append((src, str(path), key))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(todo) or 1))
+    args = ([p for _, p, _ in todo], [k for _, _, k in todo], [str(out_dir)] * len(todo))
+    if jobs == 1:
+        results = list(map(_process_or_error, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_process_or_error, *args))
+    failed = {}
+    for (src, _, _), entry in zip(todo, results):
+        if "error" in entry:
+            failed[src] = entry["error"]
+            continue
+        timing = entry.pop("ms")
+        images[src] = entry
+        print(f"{src}: {len(entry['variants'])} variants, q{entry['quality']} ({timing} ms)")
+
+    removed = 0
+    if prune:
+        keep = {v["src"].rsplit("/", 1)[-1] for e in images.values() for v in e["variants"]}
+        for stale in out_dir.glob("*.webp"):
+            if stale.name not in keep:
+                stale.unlink()
+                removed += 1
+
+    payload = {"version": MANIFEST_VERSION, "widths": list(WIDTHS), "images": dict(sorted(images.items()))}
+    write_if_changed(manifest_path, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+    return {
+        "sources": len(sources),
+        "encoded": len(results) - len(failed),
+        "cached": len(images) - len(results) + len(failed),
+        "missing": missing,
+        "failed": failed,
+        "removed": removed,
+        "jobs": jobs,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--public", type=pathlib.Path, default=PUBLIC_DIR, help="public directory (default public)")
+    parser.add_argument("--manifest", type=pathlib.Path, default=MANIFEST_PATH, help="variant manifest path")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--force", "-f", action="store_true", help="ignore cache hits and re-encode everything")
+    parser.add_argument("--prune", action="store_true", help="delete variants no longer in the manifest")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if Image is None:
+        print("Pillow is required: pip install pillow", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    sources = referenced_images(args.base)
+    summary = run(sources, args.public, args.manifest, args.jobs, args.force, args.prune)
+    for src in summary["missing"]:
+        print(f"Warning: missing source {src}", file=sys.stderr)
+    for src, error in summary["failed"].items():
+        print(f"Warning: could not process {src}: {error}", file=sys.stderr)
+    print(
+        f"Images: {summary['sources']} referenced, {summary['encoded']} encoded, {summary['cached']} cached, "
+        f"{summary['removed']} pruned, {len(summary['missing'])} missing, {len(summary['failed'])} failed "
+        f"({time.perf_counter() - started:.1f} s, {summary['jobs']} jobs)."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
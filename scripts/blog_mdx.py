@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Parse, render and stream blog MDX documents (front matter + body).
+
+Rendering emits front matter in the shape the blog already uses (canonical key
+order, prettier-style quoting), so render(parse(text)) round-trips the files
+under data/blog. Requires PyYAML (pip install pyyaml).
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import pathlib
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import yaml
+
+from blog_writer import BASE, ROOT
+
+LOCALES = ("en", "de", "nl")
+SITE_METADATA = ROOT / "data" / "siteMetadata.js"
+
+# Key order used by every article in data/blog; unknown keys follow in source order.
+FRONT_MATTER_ORDER = (
+    "title",
+    "date",
+    "lastmod",
+    "draft",
+    "summary",
+    "tags",
+    "authors",
+    "layout",
+    "images",
+    "keywords",
+    "bibliography",
+    "canonicalUrl",
+)
+QUOTED_KEYS = ("title", "summary")
+
+# The libyaml-backed loader is ~10x faster; fall back to pure Python without it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# ![alt](/static/images/blog/x.webp "title") -> group 1 is the URL.
+MARKDOWN_IMAGE_RE = re.compile(r"!\[[^\]]*\]\(([^)\s]+)[^)]*\)")
+
+_SITE_FIELD_RE = re.compile(r"^  (\w+):\s*(['`])(.*?)\2,$", re.M | re.S)
+_SITE_OBJECT_RE = re.compile(r"^ {2,}(\w+):\s*\{$")
+_SITE_NESTED_FIELD_RE = re.compile(r"^ {4,}(\w+):\s*(['`])(.*)\2,?$")
+_BASE_PATH_EXPR = "${process.env.BASE_PATH || ''}"
+
+
+def split_list(values: list[str] | None) -> list[str]:
+    """Flatten a repeatable, comma-separated argparse option ("-l de,nl -l en")."""
+    return [v.strip() for item in values or [] for v in item.split(",") if v.strip()]
+
+
+def parse_locales(parser: argparse.ArgumentParser, values: list[str] | None) -> list[str]:
+    """--lang values as a list of locales (all of them when none are given); unknown ones are a usage error."""
+    langs = split_list(values) or list(LOCALES)
+    unknown = [l for l in langs if l not in LOCALES]
+    if unknown:
+        parser.error(f"unknown locale(s): {', '.join(unknown)}")
+    return langs
+
+
+def read_site_metadata(path: pathlib.Path = SITE_METADATA) -> dict[str, str]:
+    """String fields of data/siteMetadata.js.
+
+    Top-level fields keep their name (siteUrl, title, email, ...); fields of
+    nested objects get a dotted one ("search.kbarConfig.searchDocumentsPath").
+    """
+    text = path.read_text(encoding="utf-8")
+    fields = {key: value for key, _, value in _SITE_FIELD_RE.findall(text)}
+    parents: list[tuple[int, str]] = []
+    for line in text.splitlines():
+        indent = len(line) - len(line.lstrip(" "))
+        while parents and parents[-1][0] >= indent:
+            parents.pop()
+        if m := _SITE_OBJECT_RE.match(line):
+            parents.append((indent, m.group(1)))
+        elif parents and (m := _SITE_NESTED_FIELD_RE.match(line)):
+            fields[".".join([*(key for _, key in parents), m.group(1)])] = m.group(3)
+    base_path = os.environ.get("BASE_PATH", "")
+    return {key: value.replace(_BASE_PATH_EXPR, base_path) for key, value in fields.items()}
+
+
+class FrontMatterError(ValueError):
+    pass
+
+
+@dataclass
+class Document:
+    slug: str
+    lang: str
+    front_matter: dict
+    body: str
+    path: pathlib.Path | None = None
+
+    def render(self) -> str:
+        return render(self.front_matter, self.body)
+
+
+def split_front_matter(text: str) -> tuple[str, str]:
+    """Return (front matter source, body). Raises FrontMatterError if missing."""
+    if not text.startswith("---\n"):
+        raise FrontMatterError("missing opening '---'")
+    end = text.find("\n---\n", 3)
+    if end < 0:
+        if text.endswith("\n---"):
+            end = len(text) - 4
+        else:
+            raise FrontMatterError("missing closing '---'")
+    return text[4 : end + 1], text[end + 5 :]
+
+
+def parse(text: str) -> tuple[dict, str]:
+    source, body = split_front_matter(text)
+    try:
+        data = yaml.load(source, Loader=YAML_LOADER) or {}
+    except yaml.YAMLError as exc:
+        raise FrontMatterError(str(exc)) from exc
+    if not isinstance(data, dict):
+        raise FrontMatterError("front matter is not a mapping")
+    return data, body
+
+
+def read_document(path: pathlib.Path, lang: str | None = None) -> Document:
+    front_matter, body = parse(path.read_text(encoding="utf-8"))
+    return Document(path.stem, lang or path.parent.name, front_matter, body, path)
+
+
+def _quote(value: str) -> str:
+    if "'" in value and '"' not in value:
+        return '"' + value.replace("\\", "\\\\") + '"'
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _needs_quotes(value: str) -> bool:
+    if not value or value != value.strip() or "\n" in value:
+        return True
+    try:
+        return yaml.safe_load(f"k: {value}") != {"k": value}
+    except yaml.YAMLError:
+        return True
+
+
+def _scalar(value, quoted: bool = False) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    if isinstance(value, (int, float)):
+        return str(value)
+    value = str(value)
+    return _quote(value) if quoted or _needs_quotes(value) else value
+
+
+def render_front_matter(front_matter: dict) -> str:
+    keys = [k for k in FRONT_MATTER_ORDER if k in front_matter]
+    keys += [k for k in front_matter if k not in FRONT_MATTER_ORDER]
+    lines = []
+    for key in keys:
+        value = front_matter[key]
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            lines.append(f"{key}:")
+            lines.extend(f"  - {_scalar(item)}" for item in value)
+        elif isinstance(value, dict):
+            raise FrontMatterError(f"nested mapping for {key!r} is not supported")
+        else:
+            lines.append(f"{key}: {_scalar(value, key in QUOTED_KEYS)}")
+    return "\n".join(lines) + "\n"
+
+
+def render(front_matter: dict, body: str) -> str:
+    return "---\n" + render_front_matter(front_matter) + "---\n" + body
+
+
+def iter_paths(
+    base: pathlib.Path = BASE,
+    langs: Iterable[str] = LOCALES,
+    slugs: Iterable[str] | None = None,
+) -> Iterator[tuple[str, pathlib.Path]]:
+    """Yield (lang, path) for every .mdx under base/{lang}, sorted by slug."""
+    wanted = set(slugs) if slugs else None
+    for lang in langs:
+        directory = base / lang
+        if not directory.is_dir():
+            continue
+        with os.scandir(directory) as it:
+            names = sorted(e.name for e in it if e.is_file() and e.name.endswith(".mdx"))
+        for name in names:
+            if wanted is None or name[:-4] in wanted:
+                yield lang, directory / name
+
+
+def iter_documents(
+    base: pathlib.Path = BASE,
+    langs: Iterable[str] = LOCALES,
+    slugs: Iterable[str] | None = None,
+) -> Iterator[Document]:
+    """Stream parsed documents one at a time; nothing is held beyond the current file."""
+    for lang, path in iter_paths(base, langs, slugs):
+        yield read_document(path, lang)
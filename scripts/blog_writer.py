@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incremental, content-hashed MDX writer backed by a build manifest.
+
+Every rendered document is hashed and compared with the manifest persisted by
+the previous run. Identical files are left untouched, so their mtimes do not
+move and contentlayer / next build only reprocess what actually changed.
+Changed files are written atomically (temp file + rename).
+
+Manifest: .cache/mdx-manifest.json, keyed by path relative to the repo root.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from dataclasses import dataclass
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+BASE = ROOT / "data" / "blog"
+MANIFEST_PATH = ROOT / ".cache" / "mdx-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: pathlib.Path) -> str | None:
+    try:
+        return content_hash(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write_bytes(path: pathlib.Path, data: bytes) -> None:
+    """Write data to path via a temp file in the same directory + os.replace."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path: pathlib.Path, data: bytes) -> bool:
+    """Atomically write data unless path already holds exactly these bytes."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def load_json(path: pathlib.Path, default, version: int | None = None):
+    """Parsed JSON at path, or default if it is missing or corrupt.
+
+    With a version, also default unless the data is an object whose "version"
+    matches (the format of every cache and manifest here).
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+    if version is not None and (not isinstance(data, dict) or data.get("version") != version):
+        return default
+    return data
+
+
+@dataclass
+class WriteStats:
+    written: int = 0
+    skipped: int = 0
+    removed: int = 0
+
+    def __str__(self) -> str:
+        return f"written={self.written} skipped={self.skipped} removed={self.removed}"
+
+
+class MdxWriter:
+    """Writes MDX documents only when their content hash changed.
+
+    Use as a context manager so the manifest is saved on exit:
+
+        with MdxWriter() as writer:
+            writer.write(BASE / "de" / "slug.mdx", content)
+        print(writer.stats)
+    """
+
+    def __init__(
+        self,
+        manifest_path: pathlib.Path = MANIFEST_PATH,
+        root: pathlib.Path = ROOT,
+        dry_run: bool = False,
+        verbose: bool = True,
+    ) -> None:
+        self.manifest_path = manifest_path
+        self.root = root
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.stats = WriteStats()
+        self._previous = self._load_manifest()
+        self._entries: dict[str, dict] = {}
+
+    def _load_manifest(self) -> dict[str, dict]:
+        return load_json(self.manifest_path, {}, MANIFEST_VERSION).get("files", {})
+
+    def _key(self, path: pathlib.Path) -> str:
+        path = path.resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _entry(self, path: pathlib.Path, digest: str) -> dict:
+        st = path.stat()
+        return {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def _unchanged(self, path: pathlib.Path, key: str, digest: str) -> bool:
+        entry = self._previous.get(key)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        if entry and entry["sha256"] == digest and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return True
+        # No manifest entry or the file was touched outside the writer:
+        # fall back to hashing what is on disk.
+        return file_hash(path) == digest
+
+    def write(self, path: pathlib.Path, content: str) -> bool:
+        """Persist content at path unless an identical file is already there.
+
+        Returns True when the file was (or, in dry-run mode, would be) written.
+        """
+        data = content.encode("utf-8")
+        digest = content_hash(data)
+        key = self._key(path)
+        if self._unchanged(path, key, digest):
+            self.stats.skipped += 1
+            if not self.dry_run:
+                self._entries[key] = self._entry(path, digest)
+            return False
+        if not self.dry_run:
+            atomic_write_bytes(path, data)
+            self._entries[key] = self._entry(path, digest)
+        self.stats.written += 1
+        if self.verbose:
+            print("Would write" if self.dry_run else "Wrote", path)
+        return True
+
+    def keep(self, path: pathlib.Path) -> None:
+        """Mark path as produced by this run without writing it (protects it from prune)."""
+        key = self._key(path)
+        if key in self._previous:
+            self._entries[key] = self._previous[key]
+
+    def prune(self) -> None:
+        """Delete files recorded by a previous run that were not written this run.
+
+        Only call this after a full (unfiltered) run. Files edited by hand since
+        they were generated are kept and just dropped from the manifest.
+        """
+        for key, entry in self._previous.items():
+            if key in self._entries:
+                continue
+            path = self.root / key
+            if file_hash(path) == entry["sha256"]:
+                if not self.dry_run:
+                    path.unlink()
+                self.stats.removed += 1
+                if self.verbose:
+                    print("Would remove" if self.dry_run else "Removed", path)
+        self._previous = {}
+
+    def save(self) -> None:
+        if self.dry_run:
+            return
+        files = {**self._previous, **self._entries}
+        payload = {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+        write_if_changed(self.manifest_path, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+
+    def __enter__(self) -> "MdxWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.save()
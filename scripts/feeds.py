@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Generate RSS feeds and the sitemap from data/blog in one pass.
+
+Replaces rss.mjs + generate-sitemap.mjs (postbuild). Every article is read
+once; from that single walk the script writes
+
+    feed.xml, {de,nl}/feed.xml                  RSS per locale
+    [{de,nl}/]tags/{tag}/feed.xml               RSS per tag
+    sitemap.xml                                 sitemap index
+    sitemap-{en,de,nl}.xml                      URLs per locale, with
+                                                hreflang alternates
+
+into public/ (out/ when EXPORT is set). Outputs are only rewritten when their
+bytes change, and tag feeds for tags that disappeared are removed.
+
+lastmod is not the build time; it only depends on content. An article uses
+the later of its front matter lastmod/date and the last git commit of its
+file, list pages (homes, blog pages, tags) the newest article they show, and
+static pages the last commit of their page module. Rebuilding an unchanged
+checkout therefore produces byte-identical sitemaps. In a shallow clone, or
+without git, only the front matter is used.
+
+Trade-off: a commit is a change as far as the sitemap is concerned. A bulk
+rewrite that touches every article (fix-currency-symbols.mjs, a prettier
+pass, a move) would bump every post URL to that commit's time. List such
+commits in .git-blame-ignore-revs (full hashes, one per line, the file
+`git blame --ignore-revs-file` and GitHub use); their changes are skipped
+and those files keep the time of their previous commit.
+
+Usage:
+    python3 scripts/feeds.py
+    python3 scripts/feeds.py --out out
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import email.utils
+import os
+import pathlib
+import subprocess
+import sys
+import time
+import urllib.parse
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from blog_mdx import LOCALES, iter_paths, parse, read_site_metadata
+from blog_writer import BASE, ROOT, write_if_changed
+from search_index import github_slug, iso_date
+
+OUT_DIR = ROOT / ("out" if os.environ.get("EXPORT") else "public")
+PAGES_DIR = ROOT / "app" / "[locale]"
+IGNORE_REVS_PATH = ROOT / ".git-blame-ignore-revs"
+
+POSTS_PER_PAGE = 5
+PREFIXES = {"en": "", "de": "de/", "nl": "nl/"}
+FEED_LANGUAGES = {"de": "de-de", "nl": "nl-nl"}  # en uses siteMetadata.language
+DEFAULT_LANG = "en"
+URI_SAFE = "-_.!~*'()"  # what encodeURIComponent leaves alone
+
+# Unprefixed pages from generate-sitemap.mjs besides the homes: (path, priority, page module).
+STATIC_PATHS = (
+    ("blog/", 0.8, "blog/page.tsx"),
+    ("tags/", 0.8, "tags/page.tsx"),
+    ("about/", 0.8, "about/page.tsx"),
+    ("privacy-policy", 0.7, "privacy-policy/page.tsx"),
+    ("cookie-policy", 0.7, "cookie-policy/page.tsx"),
+    ("terms-of-service", 0.7, "terms-of-service/page.tsx"),
+)
+LOCALE_PRIORITY = 0.64
+HOME_PRIORITY = 1.0
+LOCALE_HOME_PRIORITY = 0.8
+
+
+@dataclass
+class Post:
+    lang: str
+    slug: str
+    title: str
+    summary: str
+    date: str
+    lastmod: str
+    tags: list[str]
+
+
+@dataclass
+class Url:
+    loc: str
+    priority: float
+    lastmod: str
+    group: tuple | None = None
+    alternates: dict[str, str] = field(default_factory=dict)
+
+
+def escape_xml(value) -> str:
+    return (
+        str(value)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&apos;")
+    )
+
+
+def rfc822(iso: str) -> str:
+    return email.utils.format_datetime(dt.datetime.fromisoformat(iso.replace("Z", "+00:00")), usegmt=True)
+
+
+def load_posts(base: pathlib.Path = BASE, commit_times: dict[str, str] | None = None) -> list[Post]:
+    """Published posts (not draft, date not in the future) of every locale, newest first.
+
+    A post's lastmod is the later of its front matter lastmod/date and the last
+    commit of its file, so an edited article moves without a manual lastmod.
+    """
+    now = iso_date(dt.datetime.now(dt.timezone.utc))
+    commit_times = commit_times or {}
+    posts = []
+    for lang, path in iter_paths(base, LOCALES):
+        fm, _ = parse(path.read_text(encoding="utf-8"))
+        if fm.get("draft") is True or not fm.get("date"):
+            continue
+        date = iso_date(fm["date"])
+        if date > now:
+            continue
+        posts.append(
+            Post(
+                lang=lang,
+                slug=path.stem,
+                title=str(fm.get("title") or ""),
+                summary=str(fm.get("summary") or ""),
+                date=date,
+                lastmod=max(
+                    iso_date(fm["lastmod"]) if fm.get("lastmod") else date,
+                    commit_times.get(str(path.resolve()), ""),
+                ),
+                tags=[str(t) for t in fm.get("tags") or []],
+            )
+        )
+    # pliny sortPosts: date descending, ties in file path order.
+    posts.sort(key=lambda p: (p.lang, p.slug))
+    posts.sort(key=lambda p: p.date, reverse=True)
+    return posts
+
+
+def posts_by_tag(posts: list[Post]) -> dict[str, list[Post]]:
+    """github-slugger tag slug -> posts, as the /tags/{tag} routes see them."""
+    by_tag: dict[str, list[Post]] = defaultdict(list)
+    for post in posts:
+        for tag in dict.fromkeys(github_slug(t) for t in post.tags):
+            if tag:
+                by_tag[tag].append(post)
+    return dict(sorted(by_tag.items()))
+
+
+# --- RSS -------------------------------------------------------------------------
+
+
+def post_link(site: dict, post: Post) -> str:
+    return f"{site['siteUrl']}/{PREFIXES[post.lang]}blog/{post.slug}"
+
+
+def render_rss(site: dict, lang: str, posts: list[Post], page: str) -> bytes:
+    prefix = PREFIXES[lang]
+    editor = f"{escape_xml(site['email'])} ({escape_xml(site['author'])})"
+    last_build = rfc822(posts[0].date) if posts else ""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">',
+        "  <channel>",
+        f"    <title>{escape_xml(site['title'])}</title>",
+        f"    <link>{site['siteUrl']}/{prefix}blog</link>",
+        f"    <description>{escape_xml(site['description'])}</description>",
+        f"    <language>{FEED_LANGUAGES.get(lang, site['language'])}</language>",
+        f"    <managingEditor>{editor}</managingEditor>",
+        f"    <webMaster>{editor}</webMaster>",
+        f"    <lastBuildDate>{last_build}</lastBuildDate>",
+        f'    <atom:link href="{site["siteUrl"]}/{page}" rel="self" type="application/rss+xml"/>',
+    ]
+    for post in posts:
+        link = post_link(site, post)
+        lines += [
+            "    <item>",
+            f"      <guid>{link}</guid>",
+            f"      <title>{escape_xml(post.title)}</title>",
+            f"      <link>{link}</link>",
+        ]
+        if post.summary:
+            lines.append(f"      <description>{escape_xml(post.summary)}</description>")
+        lines += [f"      <pubDate>{rfc822(post.date)}</pubDate>", f"      <author>{editor}</author>"]
+        lines += [f"      <category>{escape_xml(tag)}</category>" for tag in post.tags]
+        lines.append("    </item>")
+    lines += ["  </channel>", "</rss>", ""]
+    return "\n".join(lines).encode("utf-8")
+
+
+def build_feeds(site: dict, posts: list[Post]) -> dict[str, bytes]:
+    """Relative output path -> RSS bytes for every locale and tag feed."""
+    files = {}
+    for lang in LOCALES:
+        prefix = PREFIXES[lang]
+        local = [p for p in posts if p.lang == lang]
+        if not local:
+            continue
+        page = f"{prefix}feed.xml"
+        files[page] = render_rss(site, lang, local, page)
+        for tag, tagged in posts_by_tag(local).items():
+            page = f"{prefix}tags/{tag}/feed.xml"
+            files[page] = render_rss(site, lang, tagged, page)
+    return files
+
+
+# --- sitemap -----------------------------------------------------------------------
+
+
+def _ignored_revs(path: pathlib.Path = IGNORE_REVS_PATH) -> set[str]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return set()
+    return {line.split("#", 1)[0].strip() for line in lines} - {""}
+
+
+def git_commit_times(root: pathlib.Path, ignored: set[str] | None = None) -> dict[str, str]:
+    """Resolved file path -> time of the last commit touching it, for files under root.
+
+    Commits in `ignored` (default: .git-blame-ignore-revs) do not count. Empty
+    when git is unavailable, root is not tracked, or the clone is shallow
+    (every file would date from the one fetched commit).
+    """
+    ignored = _ignored_revs() if ignored is None else ignored
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", "-c", "core.quotepath=off", *args], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+
+    try:
+        if git("rev-parse", "--is-shallow-repository").strip() == "true":
+            return {}
+        log = git("log", "--format=%x00%H %cI", "--name-only", "--", str(root.resolve()))
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    times: dict[str, str] = {}
+    for chunk in log.split("\0")[1:]:
+        header, *names = chunk.strip().splitlines()
+        rev, stamp = header.split(" ", 1)
+        if rev in ignored:
+            continue
+        committed = iso_date(dt.datetime.fromisoformat(stamp))
+        for name in filter(None, names):
+            times.setdefault(str((ROOT / name).resolve()), committed)
+    return times
+
+
+def collect_urls(site: dict, posts: list[Post], page_times: dict[str, str] | None = None) -> dict[str, list[Url]]:
+    """Sitemap URLs per locale (the unprefixed static pages go to the default locale).
+
+    lastmod comes from content only: an article's own lastmod, the newest
+    member of a list page, or the last commit of a static page's module.
+    """
+    root = site["siteUrl"].rstrip("/")
+    newest = posts[0].lastmod if posts else ""
+    page_times = page_times or {}
+    urls: dict[str, dict[str, Url]] = {lang: {} for lang in LOCALES}
+
+    def add(lang: str, path: str, priority: float, lastmod: str, group=None) -> None:
+        # Later entries win, as with the Map-based dedupe in generate-sitemap.mjs.
+        loc = f"{root}/{path}"
+        urls[lang][loc] = Url(loc, priority, lastmod, group)
+
+    def newest_of(members: list[Post]) -> str:
+        return max((p.lastmod for p in members), default=newest)
+
+    def module_time(module: str) -> str:
+        return page_times.get(str((PAGES_DIR / module).resolve()), newest)
+
+    static_groups = {"blog/": "blog", "tags/": "tags", "about/": "about"}
+    for path, priority, module in STATIC_PATHS:
+        add(DEFAULT_LANG, path, priority, module_time(module), static_groups.get(path))
+
+    for lang in LOCALES:
+        prefix = PREFIXES[lang]
+        local = [p for p in posts if p.lang == lang]
+        first_page = local[:POSTS_PER_PAGE]
+        home_priority = HOME_PRIORITY if lang == DEFAULT_LANG else LOCALE_HOME_PRIORITY
+        add(lang, prefix, home_priority, max(module_time("page.tsx"), newest_of(first_page)), "home")
+        add(lang, f"{prefix}blog/", LOCALE_PRIORITY, newest_of(first_page), "blog")
+        add(lang, f"{prefix}tags/", LOCALE_PRIORITY, newest_of(local), "tags")
+        add(lang, f"{prefix}about/", LOCALE_PRIORITY, module_time("about/page.tsx"), "about")
+
+        pages = max(1, -(-len(local) // POSTS_PER_PAGE))
+        for n in range(2, pages + 1):
+            members = local[(n - 1) * POSTS_PER_PAGE : n * POSTS_PER_PAGE]
+            add(lang, f"{prefix}blog/page/{n}/", LOCALE_PRIORITY, newest_of(members))
+
+        for tag, tagged in posts_by_tag(local).items():
+            add(lang, f"{prefix}tags/{urllib.parse.quote(tag, safe=URI_SAFE)}/", LOCALE_PRIORITY, newest_of(tagged))
+
+        for post in local:
+            add(lang, f"{prefix}blog/{post.slug}/", LOCALE_PRIORITY, post.lastmod, ("post", post.slug))
+
+    groups: dict[object, dict[str, str]] = defaultdict(dict)
+    for lang, entries in urls.items():
+        for url in entries.values():
+            if url.group is not None:
+                groups[url.group].setdefault(lang, url.loc)
+    for entries in urls.values():
+        for url in entries.values():
+            alternates = groups.get(url.group, {})
+            if len(alternates) > 1:
+                url.alternates = {**alternates, "x-default": alternates.get(DEFAULT_LANG, url.loc)}
+
+    home = f"{root}/"
+    return {
+        lang: sorted(entries.values(), key=lambda u: (u.loc != home, -u.priority, u.loc))
+        for lang, entries in urls.items()
+    }
+
+
+def render_urlset(entries: list[Url]) -> bytes:
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:xhtml="http://www.w3.org/1999/xhtml">',
+    ]
+    for url in entries:
+        lines += [
+            "  <url>",
+            f"    <loc>{escape_xml(url.loc)}</loc>",
+            f"    <lastmod>{url.lastmod}</lastmod>",
+            f"    <priority>{url.priority:.2f}</priority>",
+        ]
+        lines += [
+            f'    <xhtml:link rel="alternate" hreflang="{lang}" href="{escape_xml(href)}"/>'
+            for lang, href in url.alternates.items()
+        ]
+        lines.append("  </url>")
+    lines += ["</urlset>", ""]
+    return "\n".join(lines).encode("utf-8")
+
+
+def build_sitemaps(site: dict, urls: dict[str, list[Url]]) -> dict[str, bytes]:
+    root = site["siteUrl"].rstrip("/")
+    files = {}
+    index = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for lang, entries in urls.items():
+        if not entries:
+            continue
+        name = f"sitemap-{lang}.xml"
+        files[name] = render_urlset(entries)
+        index += [
+            "  <sitemap>",
+            f"    <loc>{root}/{name}</loc>",
+            f"    <lastmod>{max(u.lastmod for u in entries)}</lastmod>",
+            "  </sitemap>",
+        ]
+    index += ["</sitemapindex>", ""]
+    files["sitemap.xml"] = "\n".join(index).encode("utf-8")
+    return files
+
+
+# --- driver ------------------------------------------------------------------------
+
+
+def generate(base: pathlib.Path = BASE, out: pathlib.Path = OUT_DIR) -> dict[str, int]:
+    site = read_site_metadata()
+    site["siteUrl"] = site["siteUrl"].rstrip("/")
+    posts = load_posts(base, git_commit_times(base))
+    urls = collect_urls(site, posts, git_commit_times(PAGES_DIR))
+    files = {**build_feeds(site, posts), **build_sitemaps(site, urls)}
+
+    stats = {"posts": len(posts), "urls": sum(map(len, urls.values())), "written": 0, "unchanged": 0, "removed": 0}
+    for rel, data in files.items():
+        stats["written" if write_if_changed(out / rel, data) else "unchanged"] += 1
+    for lang in LOCALES:
+        tags_dir = out / PREFIXES[lang] / "tags"
+        for stale in tags_dir.glob("*/feed.xml"):
+            if stale.relative_to(out).as_posix() not in files:
+                stale.unlink()
+                stats["removed"] += 1
+    return stats
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--out", type=pathlib.Path, default=OUT_DIR, help="output directory (default public, out with EXPORT)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    stats = generate(args.base, args.out)
+    print(
+        f"Feeds + sitemap: {stats['posts']} posts, {stats['urls']} URLs, written={stats['written']} "
+        f"unchanged={stats['unchanged']} removed={stats['removed']} ({(time.perf_counter() - started) * 1000:.0f} ms)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
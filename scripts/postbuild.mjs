@@ -1,9 +0,0 @@
-import rss from './rss.mjs'
-import generateSitemap from './generate-sitemap.mjs'
-
-async function postbuild() {
-  await rss()
-  await generateSitemap()
-}
-
-postbuild()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Precompute related posts per locale from tag/keyword similarity.
+
+Every article in data/blog/{lang} (drafts excluded) becomes a sparse binary row
+over its tags and keywords; columns carry a fixed field weight (tags count
+double). Similarity is weighted Jaccard,
+
+    sim(a, b) = w(a & b) / (w(a) + w(b) - w(a & b))
+
+computed for a block of rows at once as one sparse product. Terms present in
+more than half of a locale's articles ("2026", boilerplate keywords) are
+ignored. The top-k slugs per article (score desc, then newest, then slug) go
+to app/related-posts-{lang}.json, which lib/blog.ts looks up instead of
+scoring every post at render time.
+
+Incremental: the term sets of the previous run are kept in
+.cache/related-posts.json. A row is recomputed only if its article changed,
+shares a term with a changed article, or listed a changed article as related;
+all other rows are copied from the previous output. Weighted Jaccard only
+depends on the two articles compared, so this gives the same result as a
+full run. A change in the ignored-term set, --top-k or the cache format
+falls back to a full run.
+
+Requires NumPy and SciPy (pip install numpy scipy).
+
+Usage:
+    python3 scripts/related_posts.py
+    python3 scripts/related_posts.py --lang de --top-k 4
+    python3 scripts/related_posts.py --full        # ignore the cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from collections import defaultdict
+
+from blog_mdx import LOCALES, iter_documents, parse_locales
+from blog_writer import BASE, ROOT, load_json, write_if_changed
+from search_index import iso_date
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # reported in main() so --help still works
+    np = sparse = None
+
+OUT_DIR = ROOT / "app"
+OUT_NAME = "related-posts"
+CACHE_PATH = ROOT / ".cache" / "related-posts.json"
+CACHE_VERSION = 1
+
+TOP_K = 6
+FIELD_WEIGHTS = {"tag": 2.0, "kw": 1.0}
+MAX_DF = 0.5
+MIN_DOCS_FOR_DF = 10
+
+
+def article_terms(front_matter: dict) -> list[str]:
+    """Column names for one article: "tag:<tag>" and "kw:<keyword>", case-folded."""
+    terms = set()
+    for field, key in (("tag", "tags"), ("kw", "keywords")):
+        for value in front_matter.get(key) or []:
+            value = " ".join(str(value).split()).casefold()
+            if value:
+                terms.add(f"{field}:{value}")
+    return sorted(terms)
+
+
+def load_corpus(lang: str, base: pathlib.Path = BASE) -> dict[str, dict]:
+    """slug -> {terms, date} for the published articles of one locale."""
+    docs = {}
+    for doc in iter_documents(base, [lang]):
+        fm = doc.front_matter
+        if fm.get("draft") is True:
+            continue
+        docs[doc.slug] = {"terms": article_terms(fm), "date": iso_date(fm["date"]) if fm.get("date") else ""}
+    return docs
+
+
+def ignored_terms(docs: dict[str, dict]) -> list[str]:
+    if len(docs) < MIN_DOCS_FOR_DF:
+        return []
+    df: dict[str, int] = defaultdict(int)
+    for doc in docs.values():
+        for term in doc["terms"]:
+            df[term] += 1
+    return sorted(t for t, n in df.items() if n > MAX_DF * len(docs))
+
+
+def build_matrix(slugs: list[str], docs: dict[str, dict], ignored: set[str]):
+    """Binary CSR matrix (articles x terms) plus the per-column weights."""
+    vocab: dict[str, int] = {}
+    indptr, indices = [0], []
+    for slug in slugs:
+        cols = sorted(vocab.setdefault(t, len(vocab)) for t in docs[slug]["terms"] if t not in ignored)
+        indices.extend(cols)
+        indptr.append(len(indices))
+    X = sparse.csr_matrix(
+        (np.ones(len(indices)), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+        shape=(len(slugs), len(vocab)),
+    )
+    weights = np.empty(len(vocab))
+    for term, col in vocab.items():
+        weights[col] = FIELD_WEIGHTS[term.split(":", 1)[0]]
+    return X, weights
+
+
+def related_rows(
+    rows: list[int], slugs: list[str], docs: dict[str, dict], X, weights, k: int = TOP_K
+) -> dict[str, list[str]]:
+    """Top-k related slugs for the given row indices, from one sparse product."""
+    if not rows:
+        return {}
+    Xw = X.multiply(weights).tocsr()
+    totals = np.asarray(Xw.sum(axis=1)).ravel()
+    # Row i of `inter` holds w(a_i & b) for every b that shares at least one term.
+    inter = (Xw[rows] @ X.T).tocsr()
+    dates = np.array([docs[s]["date"] for s in slugs])
+    date_rank = np.argsort(np.argsort(dates, kind="stable"), kind="stable")  # higher = newer
+    result = {}
+    for r, i in enumerate(rows):
+        start, end = inter.indptr[r], inter.indptr[r + 1]
+        cols, shared = inter.indices[start:end], inter.data[start:end]
+        keep = cols != i
+        cols, shared = cols[keep], shared[keep]
+        scores = shared / (totals[i] + totals[cols] - shared)
+        order = np.lexsort((cols, -date_rank[cols], -scores))[:k]
+        result[slugs[i]] = [slugs[c] for c in cols[order]]
+    return result
+
+
+def affected_slugs(previous: dict[str, dict], docs: dict[str, dict], previous_rows: dict[str, list[str]]) -> set[str]:
+    """Rows whose top-k can differ from the previous run."""
+    changed = {s for s in previous.keys() | docs.keys() if previous.get(s) != docs.get(s)}
+    touched = set()
+    for slug in changed:
+        touched.update(previous.get(slug, {}).get("terms", ()))
+        touched.update(docs.get(slug, {}).get("terms", ()))
+    affected = set()
+    for slug, doc in docs.items():
+        if (
+            slug in changed
+            or slug not in previous_rows
+            or not touched.isdisjoint(doc["terms"])
+            or not changed.isdisjoint(previous_rows[slug])
+        ):
+            affected.add(slug)
+    return affected
+
+
+def update_locale(lang: str, docs: dict[str, dict], previous: dict, previous_rows: dict, k: int = TOP_K):
+    """Return (rows, recomputed) for one locale, reusing previous rows where possible."""
+    slugs = sorted(docs)
+    ignored = ignored_terms(docs)
+    full = not previous or previous.get("ignored") != ignored or previous.get("k") != k
+    if full:
+        todo = set(slugs)
+    else:
+        todo = affected_slugs(previous["docs"], docs, previous_rows)
+    X, weights = build_matrix(slugs, docs, set(ignored))
+    index = {s: i for i, s in enumerate(slugs)}
+    fresh = related_rows(sorted(index[s] for s in todo), slugs, docs, X, weights, k)
+    rows = {s: fresh[s] if s in fresh else previous_rows[s] for s in slugs}
+    return rows, len(fresh), {"k": k, "ignored": ignored, "docs": docs}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lang", "-l", action="append", help=f"only these locales ({', '.join(LOCALES)})")
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--out", type=pathlib.Path, default=OUT_DIR, help="output directory (default app)")
+    parser.add_argument("--top-k", "-k", type=int, default=TOP_K, help="related slugs per article (default %(default)s)")
+    parser.add_argument("--full", action="store_true", help="ignore the cache and recompute every row")
+    args = parser.parse_args(argv)
+    args.lang = parse_locales(parser, args.lang)
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if np is None:
+        print("NumPy and SciPy are required: pip install numpy scipy", file=sys.stderr)
+        return 1
+    locales = {} if args.full else load_json(CACHE_PATH, {}, CACHE_VERSION).get("locales", {})
+    for lang in args.lang:
+        started = time.perf_counter()
+        path = args.out / f"{OUT_NAME}-{lang}.json"
+        docs = load_corpus(lang, args.base)
+        previous_rows = {} if lang not in locales else load_json(path, {})
+        rows, recomputed, locales[lang] = update_locale(lang, docs, locales.get(lang, {}), previous_rows, args.top_k)
+        written = write_if_changed(path, (json.dumps(rows, ensure_ascii=False, indent=2) + "\n").encode("utf-8"))
+        print(
+            f"{path.relative_to(ROOT) if path.is_relative_to(ROOT) else path}: {len(rows)} posts, "
+            f"{recomputed} rows recomputed, {'written' if written else 'unchanged'} "
+            f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+        )
+    payload = {"version": CACHE_VERSION, "locales": dict(sorted(locales.items()))}
+    write_if_changed(CACHE_PATH, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incrementally rebuild the kbar search index public/search-{lang}.json.
+
+Called from the createSearchIndex() hook in contentlayer.config.ts, so it runs
+whenever contentlayer does (next dev, next build, analyze). Like the JS hook it
+replaces, it does nothing unless siteMetadata.search.provider is 'kbar', and
+takes the file name from kbarConfig.searchDocumentsPath. Records match the
+hook's former allCoreContent(sortPosts(...)) output (front matter fields,
+readingTime, slug, path, filePath, toc, locale, structuredData), but only MDX
+files whose fingerprint changed since the last run are re-parsed. Fresh entries are spliced
+into the existing per-locale index, which keeps its date-descending order, and
+output is written compact and only when its bytes change. --compress
+additionally writes pre-compressed .gz / .br siblings (.br needs the optional
+brotli package).
+
+Fingerprints: .cache/search-fingerprints.json.
+
+Usage:
+    python3 scripts/search_index.py
+    python3 scripts/search_index.py --compress gzip,br   # not used by the build
+    python3 scripts/search_index.py --force          # ignore fingerprints
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import json
+import math
+import pathlib
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass
+
+import blog_writer
+from blog_mdx import LOCALES, iter_paths, parse, parse_locales, read_site_metadata
+from blog_writer import BASE, ROOT, atomic_write_bytes, content_hash, load_json
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for --compress br
+    brotli = None
+
+PUBLIC_DIR = ROOT / "public"
+CACHE_PATH = ROOT / ".cache" / "search-fingerprints.json"
+CACHE_VERSION = 1
+INDEX_NAME = "search"
+
+# Field order of the Blog document type in contentlayer.config.ts.
+FIELD_ORDER = (
+    "title",
+    "date",
+    "tags",
+    "lastmod",
+    "draft",
+    "summary",
+    "images",
+    "authors",
+    "layout",
+    "bibliography",
+    "canonicalUrl",
+    "keywords",
+)
+DATE_FIELDS = ("date", "lastmod")
+
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+INLINE_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+INLINE_MARK_RE = re.compile(r"(?<!\\)(\*\*|__|\*|_|`)")
+ESCAPE_RE = re.compile(r"\\([!-/:-@\[-`{-~])")
+
+
+def iso_date(value) -> str:
+    """Serialize a front matter date the way contentlayer does (UTC, ms precision)."""
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+    if isinstance(value, dt.date):
+        return f"{value.isoformat()}T00:00:00.000Z"
+    return str(value)
+
+
+def _char_class(ranges: tuple[tuple[int, int], ...]) -> str:
+    return "".join(f"{re.escape(chr(lo))}-{re.escape(chr(hi))}" for lo, hi in ranges)
+
+
+_CJK = ((0x3040, 0x309F), (0x4E00, 0x9FFF), (0xAC00, 0xD7A3), (0x20000, 0x2EBE0))
+_PUNCT = ((0x21, 0x2F), (0x3A, 0x40), (0x5B, 0x60), (0x7B, 0x7E), (0x3000, 0x303F), (0xFF00, 0xFFEF))
+_WORD_BOUND = " \n\r\t"
+# One match per counted word: a CJK character (plus the punctuation and
+# whitespace reading-time skips after it), or the last character of a
+# non-CJK word, i.e. one followed by a word boundary or a CJK character.
+_WORD_RE = re.compile(
+    f"[{_char_class(_CJK)}][{_char_class(_PUNCT)}{_WORD_BOUND}]*"
+    f"|[^{_WORD_BOUND}](?=[{_WORD_BOUND}{_char_class(_CJK)}])"
+)
+
+
+def reading_time(text: str, words_per_minute: int = 200) -> dict:
+    """Port of the reading-time npm package (v1.5) used for doc.readingTime."""
+    # reading-time looks one character past the trimmed text; that is always a boundary.
+    words = len(_WORD_RE.findall(text.strip(_WORD_BOUND) + "\n"))
+    minutes = words / words_per_minute
+    displayed = math.ceil(float(f"{minutes:.2f}"))
+    return {
+        "text": f"{displayed} min read",
+        "minutes": int(minutes) if minutes == int(minutes) else minutes,
+        "time": math.floor(minutes * 60 * 1000 + 0.5),
+        "words": words,
+    }
+
+
+def github_slug(value: str) -> str:
+    """github-slugger's slug(): lowercase, drop punctuation/symbols, spaces to '-'."""
+    kept = []
+    for ch in value.lower():
+        cat = unicodedata.category(ch)
+        if ch in "- " or cat[0] in "LMN" or cat == "Pc":
+            kept.append(ch)
+    return "".join(kept).replace(" ", "-")
+
+
+def extract_toc(body: str) -> list[dict]:
+    """Headings as pliny's extractTocHeadings reports them (fenced code skipped)."""
+    toc = []
+    in_fence = False
+    for line in body.splitlines():
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        m = HEADING_RE.match(line)
+        if not m:
+            continue
+        text = INLINE_MARK_RE.sub("", INLINE_LINK_RE.sub(r"\1", m.group(2)))
+        text = ESCAPE_RE.sub(r"\1", text).strip()
+        toc.append({"value": text, "url": "#" + github_slug(text), "depth": len(m.group(1))})
+    return toc
+
+
+def _json_value(value):
+    if isinstance(value, (dt.date, dt.datetime)):
+        return iso_date(value)
+    if isinstance(value, list):
+        return [_json_value(v) for v in value]
+    return value
+
+
+def search_entry(lang: str, path: pathlib.Path, site: dict) -> dict:
+    """Build one search record (coreContent of a Blog document)."""
+    front_matter, body = parse(path.read_text(encoding="utf-8"))
+    slug = path.stem
+    entry = {k: _json_value(front_matter[k]) for k in FIELD_ORDER if front_matter.get(k) is not None}
+    for k in DATE_FIELDS:
+        if k in entry:
+            entry[k] = iso_date(front_matter[k])
+    entry.setdefault("tags", [])
+    entry = {k: entry[k] for k in FIELD_ORDER if k in entry}
+    prefix = "" if lang == "en" else f"{lang}/"
+    images = entry.get("images")
+    entry.update(
+        {
+            "type": "Blog",
+            "readingTime": reading_time(body),
+            "slug": slug,
+            "path": f"blog/{slug}",
+            "filePath": f"blog/{lang}/{path.name}",
+            "toc": extract_toc(body),
+            "locale": lang,
+            "structuredData": {
+                "@context": "https://schema.org",
+                "@type": "BlogPosting",
+                "headline": entry.get("title"),
+                "datePublished": entry.get("date"),
+                "dateModified": entry.get("lastmod") or entry.get("date"),
+                "description": entry.get("summary"),
+                "image": images[0] if images else site.get("socialBanner"),
+                "url": f"{site.get('siteUrl', '')}/{prefix}{slug}",
+            },
+        }
+    )
+    if entry["structuredData"]["description"] is None:
+        del entry["structuredData"]["description"]
+    return entry
+
+
+def sort_posts(entries: list[dict]) -> list[dict]:
+    """pliny sortPosts: date descending, ties keep source (file path) order."""
+    ordered = sorted(entries, key=lambda e: e["filePath"])
+    return sorted(ordered, key=lambda e: e.get("date", ""), reverse=True)
+
+
+def dumps_compact(entries: list[dict]) -> bytes:
+    return json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass
+class IndexStats:
+    parsed: int = 0
+    reused: int = 0
+    removed: int = 0
+    written: int = 0
+    unchanged: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"parsed={self.parsed} reused={self.reused} removed={self.removed} "
+            f"files written={self.written} unchanged={self.unchanged}"
+        )
+
+
+def write_if_changed(path: pathlib.Path, data: bytes, stats: IndexStats) -> bool:
+    if not blog_writer.write_if_changed(path, data):
+        stats.unchanged += 1
+        return False
+    stats.written += 1
+    print("Wrote", path)
+    return True
+
+
+def write_outputs(path: pathlib.Path, data: bytes, compress: tuple[str, ...], stats: IndexStats) -> None:
+    write_if_changed(path, data, stats)
+    if "gzip" in compress:
+        write_if_changed(path.with_name(path.name + ".gz"), gzip.compress(data, 9, mtime=0), stats)
+    if "br" in compress:
+        write_if_changed(path.with_name(path.name + ".br"), brotli.compress(data, quality=11), stats)
+
+
+def index_name(site: dict) -> str | None:
+    """File stem of the kbar index in siteMetadata.js ("search"), or None when kbar search is off."""
+    path = site.get("search.kbarConfig.searchDocumentsPath")
+    if site.get("search.provider") != "kbar" or not path:
+        return None
+    return pathlib.PurePosixPath(path).name.replace(".json", "") or INDEX_NAME
+
+
+def update_locale(
+    lang: str,
+    base: pathlib.Path,
+    public: pathlib.Path,
+    cache: dict,
+    site: dict,
+    stats: IndexStats,
+    force: bool = False,
+    name: str = INDEX_NAME,
+) -> list[dict]:
+    """Return the refreshed, sorted entries for one locale, updating cache in place."""
+    existing = {} if force else {e.get("filePath"): e for e in load_json(public / f"{name}-{lang}.json", [])}
+    entries = []
+    seen = set()
+    for _, path in iter_paths(base, [lang]):
+        file_path = f"blog/{lang}/{path.name}"
+        seen.add(file_path)
+        st = path.stat()
+        fp = cache.get(file_path)
+        known = fp is not None and (fp.get("draft") or file_path in existing)
+        if known and fp["size"] == st.st_size and fp["mtime_ns"] == st.st_mtime_ns:
+            stats.reused += 1
+        else:
+            digest = content_hash(path.read_bytes())
+            if known and fp["sha256"] == digest:
+                stats.reused += 1
+            else:
+                entry = search_entry(lang, path, site)
+                existing[file_path] = entry
+                fp = {"sha256": digest, "draft": entry.get("draft") is True}
+                stats.parsed += 1
+            cache[file_path] = {**fp, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if not cache[file_path]["draft"]:
+            entries.append(existing[file_path])
+    for file_path in [k for k in cache if k.startswith(f"blog/{lang}/") and k not in seen]:
+        del cache[file_path]
+        stats.removed += 1
+    return sort_posts(entries)
+
+
+def build(
+    base: pathlib.Path = BASE,
+    public: pathlib.Path = PUBLIC_DIR,
+    langs=LOCALES,
+    compress: tuple[str, ...] = (),
+    force: bool = False,
+    cache_path: pathlib.Path = CACHE_PATH,
+    name: str = INDEX_NAME,
+) -> IndexStats:
+    stats = IndexStats()
+    site = read_site_metadata()
+    cache = {} if force else load_json(cache_path, {}, CACHE_VERSION).get("files", {})
+    combined = []
+    for lang in langs:
+        entries = update_locale(lang, base, public, cache, site, stats, force, name)
+        write_outputs(public / f"{name}-{lang}.json", dumps_compact(entries), compress, stats)
+        combined.extend(entries)
+    if tuple(langs) == LOCALES:
+        write_outputs(public / f"{name}.json", dumps_compact(sort_posts(combined)), compress, stats)
+    payload = {"version": CACHE_VERSION, "files": dict(sorted(cache.items()))}
+    atomic_write_bytes(cache_path, json.dumps(payload, indent=2).encode("utf-8"))
+    return stats
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lang", "-l", action="append", help=f"only these locales ({', '.join(LOCALES)})")
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--public", type=pathlib.Path, default=PUBLIC_DIR, help="output directory (default public)")
+    parser.add_argument("--compress", default="", help="also write pre-compressed variants: gzip, br or gzip,br")
+    parser.add_argument("--force", "-f", action="store_true", help="ignore fingerprints and re-parse everything")
+    args = parser.parse_args(argv)
+    args.lang = parse_locales(parser, args.lang)
+    args.compress = tuple(c.strip() for c in args.compress.split(",") if c.strip())
+    bad = [c for c in args.compress if c not in ("gzip", "br")]
+    if bad:
+        parser.error(f"unknown compression: {', '.join(bad)}")
+    if "br" in args.compress and brotli is None:
+        parser.error("--compress br needs the brotli package (pip install brotli)")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    name = index_name(read_site_metadata())
+    if name is None:
+        print("Search index: kbar search is not enabled in data/siteMetadata.js, nothing to do.")
+        return 0
+    stats = build(args.base, args.public, tuple(args.lang), args.compress, args.force, name=name)
+    print(f"Search index: {stats}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Build a sharded, inverted-term search index per locale.
+
+Instead of one flat array of full post records that the browser scans on every
+keystroke, each locale gets:
+
+    public/search/{lang}/docs.json           doc metadata, stored once; the array
+                                             position is the doc id
+    public/search/{lang}/shards/{prefix}.json
+                                             {token: [[doc id, weight], ...]} for
+                                             every token starting with prefix
+    public/search/{lang}/index.json          shard list, prefix length, stopwords
+                                             and the normalizer rules
+
+Tokens are normalized per locale, in this order:
+
+    1. case folding (casefold(): lower case, ß -> ss)
+    2. per-locale folds: de ä/ö/ü -> a/o/u, then ae/oe/ue -> a/o/u unless
+       preceded by a, e, i or q (so "Zinssätze" and "zinssaetze" meet, but
+       also "aktuell" -> "aktull"); nl ĳ -> ij
+    3. NFKD decomposition, then every mark (Unicode category M) is dropped
+    4. tokens are runs of [0-9a-z]; shorter than minTokenLength or a
+       stopword of the locale are skipped
+
+lib/searchShards.ts implements the same rules for queries (index.json spells
+them out and carries NORMALIZER_VERSION, which both sides must agree on). It
+fetches docs.json once and then only the shard for the first prefixLength
+characters of each query token.
+
+--bench compares query latency and payload size with public/search-{lang}.json.
+
+Usage:
+    python3 scripts/search_shards.py
+    python3 scripts/search_shards.py --lang de --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import pathlib
+import re
+import shutil
+import statistics
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+
+from blog_mdx import LOCALES, iter_documents, parse_locales
+from blog_writer import BASE, write_if_changed
+from search_index import INDEX_NAME, PUBLIC_DIR, extract_toc, iso_date, sort_posts
+
+OUT_DIR = PUBLIC_DIR / "search"
+PREFIX_LEN = 1
+MIN_TOKEN_LEN = 2
+NORMALIZER_VERSION = 2  # bump with lib/searchShards.ts whenever normalize() changes
+
+# Field weights: a title hit ranks above a tag hit, above summary/keyword/heading hits.
+FIELD_WEIGHTS = {"title": 4, "tags": 3, "keywords": 2, "summary": 1, "headings": 1}
+
+STOPWORDS = {
+    "en": frozenset(
+        "a an and are as at be by for from how in into is it its of on or that the this to vs was what when why with".split()
+    ),
+    "de": frozenset(
+        "als am an auf aus bei das dass dem den der des die ein eine einer es fur im in ist mit nach nicht oder sich"
+        " sie so um und vom von vs was wie zu zum zur".split()
+    ),
+    "nl": frozenset(
+        "aan als bij dat de den der die dit een en het hoe in is met naar niet of om op te van voor vs wat waarom"
+        " wie zijn".split()
+    ),
+}
+
+TOKEN_PATTERN = r"[0-9a-z]+"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+FOLDS = {"de": {"ä": "a", "ö": "o", "ü": "u"}, "nl": {"ĳ": "ij"}}
+DIGRAPHS = {"de": r"(?<![aeiq])(ae|oe|ue)"}  # replaced by the digraph's first letter
+DIGRAPH_RES = {lang: re.compile(pattern) for lang, pattern in DIGRAPHS.items()}
+
+
+def normalize(text: str, lang: str) -> str:
+    """Locale-aware folding shared by the index and the query side (see the module docstring)."""
+    text = text.casefold()
+    for src, dst in FOLDS.get(lang, {}).items():
+        text = text.replace(src, dst)
+    if lang in DIGRAPH_RES:
+        text = DIGRAPH_RES[lang].sub(lambda m: m.group(1)[0], text)
+    # casefold() already turned ß into "ss"; drop the marks NFKD splits off (é -> e).
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.category(ch).startswith("M"))
+
+
+def normalizer_rules(lang: str) -> dict:
+    """normalize() and tokenize() as data, for index.json."""
+    return {
+        "casefold": True,
+        "folds": FOLDS.get(lang, {}),
+        "digraphs": DIGRAPHS.get(lang),
+        "decompose": "NFKD",
+        "stripMarks": "\\p{M}",
+        "token": TOKEN_PATTERN,
+    }
+
+
+def tokenize(text: str, lang: str) -> list[str]:
+    stop = STOPWORDS.get(lang, frozenset())
+    return [t for t in TOKEN_RE.findall(normalize(text, lang)) if len(t) >= MIN_TOKEN_LEN and t not in stop]
+
+
+def shard_key(token: str, prefix_len: int = PREFIX_LEN) -> str:
+    return token[:prefix_len]
+
+
+def doc_record(doc) -> dict:
+    """Metadata the result list needs; everything else stays out of the payload."""
+    fm = doc.front_matter
+    images = fm.get("images") or []
+    record = {
+        "slug": doc.slug,
+        "title": fm.get("title", ""),
+        "summary": fm.get("summary", ""),
+        "date": iso_date(fm["date"]) if fm.get("date") else "",
+        "tags": [str(t) for t in fm.get("tags") or []],
+    }
+    if images:
+        record["image"] = images[0]
+    return record
+
+
+def build_locale(
+    lang: str, base: pathlib.Path = BASE, prefix_len: int = PREFIX_LEN
+) -> tuple[list[dict], dict[str, dict[str, list]]]:
+    """Return (docs, shards) for one locale; shards map prefix -> token -> postings."""
+    entries = []
+    for doc in iter_documents(base, [lang]):
+        if doc.front_matter.get("draft") is True:
+            continue
+        fields = {
+            "title": [doc.front_matter.get("title") or ""],
+            "tags": [str(t) for t in doc.front_matter.get("tags") or []],
+            "keywords": [str(k) for k in doc.front_matter.get("keywords") or []],
+            "summary": [doc.front_matter.get("summary") or ""],
+            "headings": [h["value"] for h in extract_toc(doc.body)],
+        }
+        weights: dict[str, int] = defaultdict(int)
+        for field, values in fields.items():
+            for value in values:
+                for token in set(tokenize(value, lang)):
+                    weights[token] += FIELD_WEIGHTS[field]
+        record = doc_record(doc)
+        record["filePath"] = f"blog/{lang}/{doc.slug}.mdx"
+        entries.append((record, weights))
+
+    order = sort_posts([record for record, _ in entries])
+    doc_id = {r["filePath"]: i for i, r in enumerate(order)}
+    shards: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    for record, weights in entries:
+        i = doc_id[record["filePath"]]
+        for token, weight in weights.items():
+            shards[shard_key(token, prefix_len)][token].append([i, weight])
+    for postings_by_token in shards.values():
+        for postings in postings_by_token.values():
+            postings.sort()
+    docs = [{k: v for k, v in r.items() if k != "filePath"} for r in order]
+    return docs, {k: dict(sorted(v.items())) for k, v in sorted(shards.items())}
+
+
+def dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_locale(
+    lang: str, docs: list[dict], shards: dict, out: pathlib.Path = OUT_DIR, prefix_len: int = PREFIX_LEN
+) -> tuple[int, int]:
+    """Write one locale's index; returns (files written, files unchanged). Stale shards are removed."""
+    target = out / lang
+    shard_dir = target / "shards"
+    files = {target / "docs.json": dumps(docs)}
+    files[target / "index.json"] = dumps(
+        {
+            "version": NORMALIZER_VERSION,
+            "lang": lang,
+            "docs": len(docs),
+            "prefixLength": prefix_len,
+            "minTokenLength": MIN_TOKEN_LEN,
+            "stopwords": sorted(STOPWORDS.get(lang, ())),
+            "normalizer": normalizer_rules(lang),
+            "shards": list(shards),
+        }
+    )
+    for prefix, postings in shards.items():
+        files[shard_dir / f"{prefix}.json"] = dumps(postings)
+    written = unchanged = 0
+    for path, data in files.items():
+        if write_if_changed(path, data):
+            written += 1
+        else:
+            unchanged += 1
+    if shard_dir.is_dir():
+        for stale in shard_dir.glob("*.json"):
+            if stale not in files:
+                stale.unlink()
+    return written, unchanged
+
+
+# --- benchmark -----------------------------------------------------------------
+
+
+def flat_query(records: list[dict], query: str) -> list[int]:
+    """What the client does today: a substring scan over every full record."""
+    q = query.lower()
+    hits = []
+    for i, r in enumerate(records):
+        haystack = " ".join([r.get("title", ""), r.get("summary", ""), " ".join(map(str, r.get("tags", [])))]).lower()
+        if q in haystack:
+            hits.append(i)
+    return hits
+
+
+def sharded_query(lang: str, query: str, load_shard, prefix_len: int = PREFIX_LEN) -> list[int]:
+    """Prefix-match every query token in its shard; AND across tokens, rank by weight.
+
+    Same algorithm as searchShards() in lib/searchShards.ts, which --bench stands in for.
+    """
+    scores: dict[int, int] | None = None
+    for token in tokenize(query, lang):
+        shard = load_shard(shard_key(token, prefix_len))
+        token_scores: dict[int, int] = defaultdict(int)
+        for term, postings in shard.items():
+            if term.startswith(token):
+                for doc, weight in postings:
+                    token_scores[doc] += weight
+        if scores is None:
+            scores = dict(token_scores)
+        else:
+            scores = {d: s + token_scores[d] for d, s in scores.items() if d in token_scores}
+    if not scores:
+        return []
+    return sorted(scores, key=lambda d: (-scores[d], d))
+
+
+def _sizes(data: bytes) -> dict[str, int]:
+    return {"raw": len(data), "gzip": len(gzip.compress(data, 9, mtime=0))}
+
+
+def benchmark(lang: str, out: pathlib.Path = OUT_DIR, public: pathlib.Path = PUBLIC_DIR, rounds: int = 200) -> dict:
+    flat_path = public / f"{INDEX_NAME}-{lang}.json"
+    flat_bytes = flat_path.read_bytes()
+    records = json.loads(flat_bytes)
+    target = out / lang
+    prefix_len = json.loads((target / "index.json").read_bytes())["prefixLength"]
+    docs_bytes = (target / "docs.json").read_bytes()
+    shard_files = {p.stem: p.read_bytes() for p in (target / "shards").glob("*.json")}
+    shard_cache = {k: json.loads(v) for k, v in shard_files.items()}
+    load_shard = lambda key: shard_cache.get(key, {})  # noqa: E731 - shards already fetched
+
+    # Realistic queries: title words and tags from the corpus, as typed prefixes too.
+    queries = []
+    for r in records[:: max(1, len(records) // 10)]:
+        words = [w for w in r.get("title", "").split() if len(w) > 3]
+        if words:
+            queries.extend([words[0], words[0][:3], " ".join(words[:2])])
+        queries.extend(str(t) for t in r.get("tags", [])[:1])
+
+    def timed(fn) -> dict:
+        samples = []
+        for _ in range(max(1, rounds // len(queries))):
+            for q in queries:
+                t0 = time.perf_counter()
+                fn(q)
+                samples.append((time.perf_counter() - t0) * 1e6)
+        samples.sort()
+        return {
+            "median_us": round(statistics.median(samples), 2),
+            "p95_us": round(samples[int(len(samples) * 0.95) - 1], 2),
+        }
+
+    touched = [len(shard_files.get(shard_key(t, prefix_len), b"")) for q in queries for t in tokenize(q, lang)]
+    avg_shard = int(statistics.mean(touched)) if touched else 0
+    return {
+        "lang": lang,
+        "docs": len(records),
+        "queries": len(queries),
+        "flat": {"payload": _sizes(flat_bytes), "latency": timed(lambda q: flat_query(records, q))},
+        "sharded": {
+            "payload": {
+                "docs": _sizes(docs_bytes),
+                "shards": len(shard_files),
+                "avg_shard_fetched_raw": avg_shard,
+                "all_shards_raw": sum(len(v) for v in shard_files.values()),
+            },
+            "latency": timed(lambda q: sharded_query(lang, q, load_shard, prefix_len)),
+        },
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lang", "-l", action="append", help=f"only these locales ({', '.join(LOCALES)})")
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--out", type=pathlib.Path, default=OUT_DIR, help="output directory (default public/search)")
+    parser.add_argument(
+        "--prefix-len", type=int, default=PREFIX_LEN, help=f"shard key length, 1 to {MIN_TOKEN_LEN} (default %(default)s)"
+    )
+    parser.add_argument("--bench", action="store_true", help="compare against public/search-{lang}.json afterwards")
+    parser.add_argument("--clean", action="store_true", help="remove the output directory of each locale first")
+    args = parser.parse_args(argv)
+    args.lang = parse_locales(parser, args.lang)
+    # shard_key() slices token[:n]: 0 or less gives an empty or tail-cut key, and n up to
+    # MIN_TOKEN_LEN keeps every key the same length.
+    if not 1 <= args.prefix_len <= MIN_TOKEN_LEN:
+        parser.error(f"--prefix-len must be between 1 and {MIN_TOKEN_LEN}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    for lang in args.lang:
+        if args.clean:
+            shutil.rmtree(args.out / lang, ignore_errors=True)
+        docs, shards = build_locale(lang, args.base, args.prefix_len)
+        written, unchanged = write_locale(lang, docs, shards, args.out, args.prefix_len)
+        tokens = sum(len(v) for v in shards.values())
+        print(
+            f"search/{lang}: {len(docs)} docs, {tokens} tokens in {len(shards)} shards "
+            f"(written={written} unchanged={unchanged})"
+        )
+    if args.bench:
+        report = [benchmark(lang, args.out) for lang in args.lang]
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
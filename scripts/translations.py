@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Generate data/blog/{en,de,nl} articles from a declarative translation bundle.
+
+Bundle layout (default data/translations):
+
+    <slug>/meta.yml     optional front matter shared by every locale of the slug
+                        (date, images, keywords, layout, authors, ...)
+    <slug>/<lang>.mdx   per-locale source: front matter (title, summary, tags, ...)
+                        + body; keys here override meta.yml
+
+meta.yml may also set `validate: warn` (or `off`) to relax the PRD check for
+that slug, e.g. for legacy articles that predate the limits; it is not written
+to the output. A looser --validate on the command line still wins.
+
+Sources are streamed one document at a time through a single
+parse -> merge -> render -> write pipeline, so memory stays flat no matter how
+many slugs a run covers. Every document is validated against the PRD limits
+(validate_blog.py) before it is written; writes are incremental (see
+blog_writer.MdxWriter).
+
+Usage:
+    python3 scripts/translations.py                       # everything
+    python3 scripts/translations.py --slug my-post --lang de
+    python3 scripts/translations.py --dry-run
+    python3 scripts/translations.py --validate warn      # write even if PRD checks fail
+    python3 scripts/translations.py --prune               # full run, drop stale outputs
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+from typing import Iterable, Iterator
+
+import yaml
+
+from blog_mdx import LOCALES, Document, FrontMatterError, parse, parse_locales, render, split_list
+from blog_writer import BASE, ROOT, MdxWriter
+from validate_blog import validate_text
+
+SOURCE_DIR = ROOT / "data" / "translations"
+META_FILE = "meta.yml"
+DEFAULTS = {"authors": ["default"], "layout": "PostLayout"}
+VALIDATE_MODES = ("strict", "warn", "off")  # strictest first
+
+
+def hero_image(slug: str) -> str:
+    return f"/static/images/blog/{slug}-hero.webp"
+
+
+def load_meta(slug_dir: pathlib.Path) -> dict:
+    path = slug_dir / META_FILE
+    if not path.is_file():
+        return {}
+    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    if not isinstance(data, dict):
+        raise FrontMatterError(f"{path}: expected a mapping")
+    return data
+
+
+def iter_sources(
+    source: pathlib.Path = SOURCE_DIR,
+    slugs: Iterable[str] | None = None,
+    langs: Iterable[str] = LOCALES,
+) -> Iterator[Document]:
+    """Yield merged source documents, one slug directory at a time."""
+    wanted = set(slugs) if slugs else None
+    with os.scandir(source) as it:
+        slug_names = sorted(e.name for e in it if e.is_dir() and not e.name.startswith("."))
+    for slug in slug_names:
+        if wanted is not None and slug not in wanted:
+            continue
+        slug_dir = source / slug
+        meta = None
+        for lang in langs:
+            path = slug_dir / f"{lang}.mdx"
+            if not path.is_file():
+                continue
+            if meta is None:
+                meta = load_meta(slug_dir)
+            try:
+                own, body = parse(path.read_text(encoding="utf-8"))
+            except FrontMatterError as exc:
+                raise FrontMatterError(f"{path}: {exc}") from exc
+            yield Document(slug, lang, build_front_matter(slug, meta, own), body, path)
+
+
+def build_front_matter(slug: str, meta: dict, own: dict) -> dict:
+    front_matter = {**DEFAULTS, **meta, **own}
+    front_matter.setdefault("images", [hero_image(slug)])
+    missing = [k for k in ("title", "date") if not front_matter.get(k)]
+    if missing:
+        raise FrontMatterError(f"{slug}: missing {', '.join(missing)}")
+    return front_matter
+
+
+def output_path(doc: Document, out: pathlib.Path = BASE) -> pathlib.Path:
+    return out / doc.lang / f"{doc.slug}.mdx"
+
+
+def bundle_validate_mode(doc: Document, validate: str) -> str:
+    """Pop a bundle's `validate` key from doc's front matter; return the looser of it and validate."""
+    mode = doc.front_matter.pop("validate", validate)
+    if mode not in VALIDATE_MODES:
+        raise FrontMatterError(f"{doc.slug}: validate must be one of {', '.join(VALIDATE_MODES)}, got {mode!r}")
+    return max(mode, validate, key=VALIDATE_MODES.index)
+
+
+def generate(
+    writer: MdxWriter,
+    source: pathlib.Path = SOURCE_DIR,
+    out: pathlib.Path = BASE,
+    slugs: Iterable[str] | None = None,
+    langs: Iterable[str] = LOCALES,
+    validate: str = "strict",
+) -> tuple[int, list[tuple[pathlib.Path, list[str], bool]]]:
+    """Run the pipeline; returns (documents rendered, [(output path, errors, rejected)]).
+
+    Each rendered document is checked with validate_blog.validate_text() before
+    it is persisted. With validate="strict" failing documents are not written,
+    unless their bundle relaxes the check (see bundle_validate_mode()).
+    """
+    count = 0
+    failures = []
+    for doc in iter_sources(source, slugs, langs):
+        path = output_path(doc, out)
+        mode = bundle_validate_mode(doc, validate)
+        text = render(doc.front_matter, doc.body)
+        count += 1
+        if mode != "off":
+            result = validate_text(text)
+            if not result["ok"]:
+                failures.append((path, result["errors"], mode == "strict"))
+                if mode == "strict":
+                    writer.keep(path)
+                    continue
+        writer.write(path, text)
+    return count, failures
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--source", type=pathlib.Path, default=SOURCE_DIR, help="translation bundle directory")
+    parser.add_argument("--out", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--slug", "-s", action="append", help="only these slugs (repeatable, comma-separated)")
+    parser.add_argument("--lang", "-l", action="append", help=f"only these locales ({', '.join(LOCALES)})")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="report what would change without writing")
+    parser.add_argument("--prune", action="store_true", help="remove generated files no longer in the bundle")
+    parser.add_argument(
+        "--validate",
+        choices=VALIDATE_MODES,
+        default="strict",
+        help="PRD check before writing: strict skips failing documents (default), warn writes them anyway",
+    )
+    parser.add_argument("--quiet", "-q", action="store_true", help="only print the summary line")
+    args = parser.parse_args(argv)
+    args.slug = split_list(args.slug)
+    args.lang = parse_locales(parser, args.lang)
+    if args.prune and (args.slug or len(args.lang) != len(LOCALES)):
+        parser.error("--prune needs a full run (no --slug/--lang filters)")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not args.source.is_dir():
+        print(f"Directory not found: {args.source}", file=sys.stderr)
+        return 1
+    with MdxWriter(dry_run=args.dry_run, verbose=not args.quiet) as writer:
+        try:
+            count, failures = generate(writer, args.source, args.out, args.slug, args.lang, args.validate)
+        except FrontMatterError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        if args.prune:
+            writer.prune()
+    for path, errors, rejected in failures:
+        print(f"{'Rejected' if rejected else 'Invalid'} {path}:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+    print(f"Done: {count} documents ({writer.stats}, invalid={len(failures)}).")
+    return 1 if any(rejected for _, _, rejected in failures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Validate blog articles in data/blog/{lang} against PRD_BLOG_ARTICLE_GENERATION.md.
+
+Python port of validate-blog-prd.mjs (same LIMITS, same checks, same messages)
+that checks every locale in one invocation, fanning files out over a process
+pool, and prints machine-readable JSON with a per-file timing breakdown.
+translations.py also calls validate_text() inline so a broken document is
+rejected before it is written.
+
+Usage:
+    python3 scripts/validate_blog.py                  # all locales
+    python3 scripts/validate_blog.py --lang de -j 4
+    python3 scripts/validate_blog.py --output validate.json --quiet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import pathlib
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from blog_mdx import LOCALES, FrontMatterError, iter_paths, parse, parse_locales
+from blog_writer import BASE
+
+# PRD limits (wordMax: toleransi +50 dari PRD 1200 agar tidak terlalu ketat)
+LIMITS = {
+    "wordMin": 900,
+    "wordMax": 1300,
+    "h2Min": 4,
+    "h2Max": 7,
+    "paraMin": 12,
+    "paraMax": 20,
+    "paraWordMin": 60,
+    "paraWordMax": 180,
+    "totalImagesMin": 3,
+    "totalImagesMax": 5,
+    "heroCount": 1,
+    "midMin": 2,
+    "titleLenMin": 50,
+    "titleLenMax": 60,
+    "summaryLenMin": 150,
+    "summaryLenMax": 160,
+    "tagsMin": 3,
+    "tagsMax": 5,
+}
+
+IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+HEADING_RE = re.compile(r"^#+\s.*$", re.M)
+H2_RE = re.compile(r"^##\s", re.M)
+DATA_SOURCE_RE = re.compile(r"\*Data source:[^*]*\*")
+EMPHASIS_RE = re.compile(r"\*[^*]+\*")
+CAPTION_RE = re.compile(r"\*[^*]*\*")
+BLOCK_SPLIT_RE = re.compile(r"\n\n+")
+SECTION_SPLIT_RE = re.compile(r"\n##\s")
+QUOTE_EDGES_RE = re.compile(r"^['\"]|['\"]$")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def js_len(text: str) -> int:
+    """String length as JavaScript counts it (UTF-16 code units)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def count_words(text: str) -> int:
+    return len([w for w in WHITESPACE_RE.split(text) if w])
+
+
+def body_for_word_count(body: str) -> str:
+    t = IMAGE_RE.sub("", body)
+    t = DATA_SOURCE_RE.sub("", t)
+    t = EMPHASIS_RE.sub("", t)
+    t = HEADING_RE.sub("", t)
+    return t.strip()
+
+
+def is_narrative_block(block: str) -> bool:
+    no_head = HEADING_RE.sub("", block).strip()
+    no_img = IMAGE_RE.sub("", no_head).strip()
+    no_cap = CAPTION_RE.sub("", no_img).strip()
+    return len(no_cap) > 20
+
+
+def narrative_paragraphs(body: str) -> list[str]:
+    blocks = [b.strip() for b in BLOCK_SPLIT_RE.split(body_for_word_count(body))]
+    return [b for b in blocks if b and is_narrative_block(b)]
+
+
+def _range_check(value: int, lo: int, hi: int) -> bool:
+    return lo <= value <= hi
+
+
+def _invalid_front_matter() -> dict:
+    dash = {"ok": False, "value": "-", "msg": "-"}
+    return {
+        "ok": False,
+        "errors": ["Frontmatter tidak valid atau tidak ada"],
+        "checklist": {
+            "frontmatter": False,
+            "words": {"ok": False, "value": "-", "msg": "Frontmatter invalid"},
+            "h2": dash,
+            "paragraphs": dash,
+            "paraLength": {"ok": False, "msg": "-"},
+            "hero": dash,
+            "images": dash,
+            "placement": {"ok": False, "msg": "-"},
+            "noClustering": {"ok": False, "msg": "-"},
+            "sectionParas": {"ok": False, "msg": "-"},
+            "title": dash,
+            "summary": dash,
+            "tags": dash,
+        },
+    }
+
+
+def validate_document(front_matter: dict, body: str) -> dict:
+    """Run every PRD check on a parsed document; mirrors validateFile() in the .mjs."""
+    L = LIMITS
+    errors: list[str] = []
+
+    if not body or not body.strip():
+        errors.append("Body kosong")
+
+    word_count = count_words(body_for_word_count(body))
+    words_ok = _range_check(word_count, L["wordMin"], L["wordMax"])
+    if not words_ok:
+        if word_count < L["wordMin"]:
+            errors.append(f"Kata: {word_count} (min {L['wordMin']})")
+        else:
+            errors.append(f"Kata: {word_count} (max {L['wordMax']})")
+
+    h2_pos = [m.start() for m in H2_RE.finditer(body)]
+    h2_count = len(h2_pos)
+    h2_ok = _range_check(h2_count, L["h2Min"], L["h2Max"])
+    if not h2_ok:
+        errors.append(f"H2: {h2_count} (harus {L['h2Min']}-{L['h2Max']})")
+
+    paras = narrative_paragraphs(body)
+    para_count = len(paras)
+    para_ok = _range_check(para_count, L["paraMin"], L["paraMax"])
+    if not para_ok:
+        errors.append(f"Paragraf naratif: {para_count} (min {L['paraMin']}, max {L['paraMax']})")
+
+    para_length_issues = []
+    for i, p in enumerate(paras):
+        w = count_words(p)
+        if w < L["paraWordMin"]:
+            para_length_issues.append(f"Paragraf {i + 1}: {w} kata (min {L['paraWordMin']})")
+        if w > L["paraWordMax"]:
+            para_length_issues.append(f"Paragraf {i + 1}: {w} kata (max {L['paraWordMax']})")
+    para_length_ok = not para_length_issues
+    errors.extend(para_length_issues)
+
+    hero_images = front_matter.get("images") if isinstance(front_matter.get("images"), list) else []
+    hero_count = len(hero_images)
+    hero_path = str(hero_images[0]) if hero_images and hero_images[0] else None
+    hero_ok = hero_count == L["heroCount"] and (not hero_path or hero_path.endswith(".webp"))
+    if not hero_ok:
+        if hero_count != L["heroCount"]:
+            errors.append(f"Hero: {hero_count} (harus tepat 1)")
+        if hero_path and not hero_path.endswith(".webp"):
+            errors.append("Hero harus format .webp")
+
+    img_pos = [m.start() for m in IMAGE_RE.finditer(body)]
+    mid_count = len(img_pos)
+    total_images = hero_count + mid_count
+    images_ok = (
+        _range_check(total_images, L["totalImagesMin"], L["totalImagesMax"]) and mid_count >= L["midMin"]
+    )
+    if not images_ok:
+        if total_images < L["totalImagesMin"]:
+            errors.append(f"Gambar total: {total_images} (min {L['totalImagesMin']})")
+        elif total_images > L["totalImagesMax"]:
+            errors.append(f"Gambar total: {total_images} (max {L['totalImagesMax']})")
+        if mid_count < L["midMin"]:
+            errors.append(f"Gambar mid-content: {mid_count} (min {L['midMin']})")
+
+    placement_ok = True
+    if h2_pos and img_pos and img_pos[0] <= h2_pos[0]:
+        placement_ok = False
+        errors.append("Gambar mid pertama harus setelah H2 pertama")
+    if len(h2_pos) >= 2 and len(img_pos) >= 2:
+        after_second = img_pos[1] > h2_pos[1]
+        after_third = len(h2_pos) >= 3 and img_pos[1] > h2_pos[2]
+        if not after_second and not after_third:
+            placement_ok = False
+            errors.append("Gambar mid kedua harus setelah H2 kedua atau ketiga")
+
+    # Map each image to the narrative paragraph it follows. Block offsets assume
+    # a two-character separator, exactly like the .mjs implementation.
+    blocks = BLOCK_SPLIT_RE.split(body)
+    block_starts = []
+    cum = 0
+    for b in blocks:
+        block_starts.append(cum)
+        cum += len(b) + 2
+    block_starts.append(len(body) + 1)
+    narrative_idx = 0
+    block_to_narrative = []
+    for b in blocks:
+        b = b.strip()
+        if len(b) >= 20 and is_narrative_block(b):
+            block_to_narrative.append(narrative_idx)
+            narrative_idx += 1
+        else:
+            block_to_narrative.append(-1)
+    image_to_para = []
+    for pos in img_pos:
+        bi = 0
+        while bi < len(block_starts) - 1 and pos >= block_starts[bi + 1]:
+            bi += 1
+        ni = block_to_narrative[bi] if bi < len(block_to_narrative) else -1
+        if ni < 0:
+            for j in range(min(bi, len(block_to_narrative)) - 1, -1, -1):
+                if block_to_narrative[j] >= 0:
+                    ni = block_to_narrative[j]
+                    break
+        image_to_para.append(max(ni, 0))
+    no_clustering_ok = True
+    if narrative_idx > 0 and image_to_para and total_images > 0:
+        last20_start = math.ceil(narrative_idx * 0.8)
+        in_last20 = sum(1 for ni in image_to_para if ni >= last20_start)
+        if in_last20 / total_images > 0.5:
+            no_clustering_ok = False
+            errors.append(">50% gambar di 20% paragraf terakhir (bottom clustering)")
+
+    section_issues = []
+    for i, section in enumerate(SECTION_SPLIT_RE.split(body)[1:]):
+        section_paras = [
+            b.strip()
+            for b in BLOCK_SPLIT_RE.split(section)
+            if b.strip() and len(CAPTION_RE.sub("", IMAGE_RE.sub("", b.strip()).strip()).strip()) > 20
+        ]
+        if len(section_paras) < 2:
+            section_issues.append(f"Section {i + 1}: {len(section_paras)} paragraf (min 2)")
+            errors.append(f"Section {i + 1}: hanya {len(section_paras)} paragraf (min 2)")
+    section_paras_ok = not section_issues
+
+    title = QUOTE_EDGES_RE.sub("", str(front_matter.get("title") or ""))
+    title_len = js_len(title)
+    title_ok = _range_check(title_len, L["titleLenMin"], L["titleLenMax"])
+    if not title_ok:
+        errors.append(f"Title: {title_len} karakter (harus {L['titleLenMin']}-{L['titleLenMax']})")
+
+    summary = QUOTE_EDGES_RE.sub("", str(front_matter.get("summary") or ""))
+    summary_len = js_len(summary)
+    summary_ok = _range_check(summary_len, L["summaryLenMin"], L["summaryLenMax"])
+    if not summary_ok:
+        errors.append(f"Summary: {summary_len} karakter (harus {L['summaryLenMin']}-{L['summaryLenMax']})")
+
+    tags = front_matter.get("tags")
+    tag_count = len(tags) if isinstance(tags, list) else 0
+    tags_ok = _range_check(tag_count, L["tagsMin"], L["tagsMax"])
+    if not tags_ok:
+        errors.append(f"Tags: {tag_count} (harus {L['tagsMin']}-{L['tagsMax']})")
+
+    def item(ok: bool, value, msg: str) -> dict:
+        return {"ok": ok, "value": str(value), "msg": None if ok else msg}
+
+    return {
+        "ok": not errors,
+        "errors": errors,
+        "wordCount": word_count,
+        "h2Count": h2_count,
+        "paraCount": para_count,
+        "totalImages": total_images,
+        "checklist": {
+            "frontmatter": True,
+            "words": item(words_ok, word_count, f"min {L['wordMin']}" if word_count < L["wordMin"] else f"max {L['wordMax']}"),
+            "h2": item(h2_ok, h2_count, f"harus {L['h2Min']}-{L['h2Max']}"),
+            "paragraphs": item(para_ok, para_count, f"min {L['paraMin']}"),
+            "paraLength": {
+                "ok": para_length_ok,
+                "msg": None if para_length_ok else para_length_issues[0],
+            },
+            "hero": item(hero_ok, hero_count, "harus 1, .webp"),
+            "images": item(
+                images_ok,
+                f"{hero_count}+{mid_count}={total_images}",
+                f"total {L['totalImagesMin']}-{L['totalImagesMax']}, mid min {L['midMin']}",
+            ),
+            "placement": {"ok": placement_ok, "msg": None if placement_ok else "penempatan mid"},
+            "noClustering": {"ok": no_clustering_ok, "msg": None if no_clustering_ok else "bottom clustering"},
+            "sectionParas": {
+                "ok": section_paras_ok,
+                "msg": None if section_paras_ok else "min 2 paragraf per section",
+            },
+            "title": item(title_ok, title_len, f"{L['titleLenMin']}-{L['titleLenMax']} karakter"),
+            "summary": item(summary_ok, summary_len, f"{L['summaryLenMin']}-{L['summaryLenMax']} karakter"),
+            "tags": item(tags_ok, tag_count, f"{L['tagsMin']}-{L['tagsMax']} tag"),
+        },
+    }
+
+
+def validate_text(text: str) -> dict:
+    try:
+        front_matter, body = parse(text)
+    except FrontMatterError:
+        return _invalid_front_matter()
+    return validate_document(front_matter, body)
+
+
+def validate_file(lang: str, path: str) -> dict:
+    """Pool worker: read, parse and validate one file, timing each step (ms)."""
+    t0 = time.perf_counter()
+    text = pathlib.Path(path).read_text(encoding="utf-8")
+    t1 = time.perf_counter()
+    try:
+        front_matter, body = parse(text)
+    except FrontMatterError:
+        front_matter = None
+    t2 = time.perf_counter()
+    result = _invalid_front_matter() if front_matter is None else validate_document(front_matter, body)
+    t3 = time.perf_counter()
+    slug = pathlib.Path(path).stem
+    return {
+        "lang": lang,
+        "slug": slug,
+        "path": path,
+        **result,
+        "timing": {
+            "read_ms": round((t1 - t0) * 1000, 3),
+            "parse_ms": round((t2 - t1) * 1000, 3),
+            "validate_ms": round((t3 - t2) * 1000, 3),
+        },
+    }
+
+
+def _validate_batch(batch: list[tuple[str, str]]) -> list[dict]:
+    return [validate_file(lang, path) for lang, path in batch]
+
+
+def validate_tree(base: pathlib.Path = BASE, langs=LOCALES, jobs: int | None = None) -> dict:
+    started = time.perf_counter()
+    tasks = [(lang, str(path)) for lang, path in iter_paths(base, langs)]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks) or 1))
+    if jobs == 1:
+        files = _validate_batch(tasks)
+    else:
+        # One contiguous batch per worker keeps IPC to a handful of round trips.
+        size = math.ceil(len(tasks) / jobs)
+        batches = [tasks[i : i + size] for i in range(0, len(tasks), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            files = [r for batch in pool.map(_validate_batch, batches) for r in batch]
+    elapsed = time.perf_counter() - started
+    valid = sum(1 for f in files if f["ok"])
+    by_lang = {}
+    for lang in langs:
+        lang_files = [f for f in files if f["lang"] == lang]
+        by_lang[lang] = {"total": len(lang_files), "valid": sum(1 for f in lang_files if f["ok"])}
+    return {
+        "limits": LIMITS,
+        "summary": {
+            "total": len(files),
+            "valid": valid,
+            "invalid": len(files) - valid,
+            "byLang": by_lang,
+            "jobs": jobs,
+            "wall_ms": round(elapsed * 1000, 3),
+            "cpu_ms": round(sum(sum(f["timing"].values()) for f in files), 3),
+        },
+        "files": files,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lang", "-l", action="append", help=f"only these locales ({', '.join(LOCALES)})")
+    parser.add_argument("--base", type=pathlib.Path, default=BASE, help="blog content directory (default data/blog)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", "-o", type=pathlib.Path, help="write the JSON report here instead of stdout")
+    parser.add_argument("--quiet", "-q", action="store_true", help="omit passing files from the report")
+    args = parser.parse_args(argv)
+    args.lang = parse_locales(parser, args.lang)
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = validate_tree(args.base, args.lang, args.jobs)
+    if args.quiet:
+        report["files"] = [f for f in report["files"] if not f["ok"]]
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    s = report["summary"]
+    print(
+        f"Ringkasan: {s['valid']}/{s['total']} artikel valid menurut PRD ({s['wall_ms']:.0f} ms, {s['jobs']} jobs).",
+        file=sys.stderr,
+    )
+    return 1 if s["invalid"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
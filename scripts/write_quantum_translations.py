@@ -1,258 +1,22 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Write DE and NL MDX for bitcoin-quantum-timeline-2030-vs-2026 and bitcoin-quantum-attack-scenarios."""
+"""Write DE and NL MDX for bitcoin-quantum-timeline-2030-vs-2026 and bitcoin-quantum-attack-scenarios.
 
-import pathlib
+The article sources live in data/translations/<slug>/; this is a shortcut for
 
-BASE = pathlib.Path(__file__).resolve().parent.parent / "data" / "blog"
+    python3 scripts/translations.py --slug <both slugs> --lang de,nl
 
-def write_mdx(path: pathlib.Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    print("Wrote", path)
-
-# --- DE timeline ---
-de_timeline = r"""---
-title: 'EZB 2026 und Bitcoin-Quanten-Zeitplan: Warum 2030 wichtiger ist'
-date: 2026-02-19
-summary: 'EZB-Zinssätze 2026 und Eurozonen-Inflation 1,9% setzen den Makro-Rahmen. Bitcoin-Quantenbedrohung: 2030er wahrscheinlicher als 2026-Krise.'
-tags:
-  - Bitcoin
-  - Quantencomputing
-  - "2030"
-  - Krypto-Sicherheit
-authors:
-  - default
-layout: PostLayout
-images:
-  - /static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-hero.webp
-keywords:
-  - ECB interest rates 2026
-  - eurozone inflation 1.9%
-  - Bitcoin quantum threat
-  - Satoshi 1M BTC
-  - EZB Zinssätze 2026
----
-
-Die EZB-Zinssätze 2026 und die Eurozonen-Inflation von 1,9% definieren den Makro-Rahmen, vor dem Bitcoin gehalten wird. Bei einem Einlagenfazilitätssatz von 2,00% und datenabhängiger EU-Geldpolitik beeinflussen DAX-40-Prognose und Risikosentiment die Allokation. Die **Bitcoin-Quantenbedrohung** hat viele fragen lassen, ob 2026 das Jahr sein wird, in dem Quanten Bitcoin bricht. CoinMarketCap und CoinShares kommen zu dem Schluss, dass Bitcoin-knackende Maschinen weit eher eine Geschichte der 2030er als eine 2026-Krise sind. Vom Satoshi-1M-BTC-Szenario bis zur breiteren Bitcoin-P2PK-Verwundbarkeit erklärt dieser Artikel, warum 2030 wichtiger ist als 2026.
-
-## Eurozonen-Inflation 1,9% und Makro-Kontext
-
-Das Inflationsziel der EZB von 2% und die Stabsprojektionen der Eurozonen-Inflation von 1,9% setzen den Ton. Der EZB-Einlagensatz 2,00% und die Hauptrefinanzierungsgeschäfte bilden den Zinskorridor. Wenn die EZB-Zinssätze 2026 stabil sind und die Eurozonen-Inflation 1,9% auf Kurs, stützt das Risikosentiment oft Bitcoin. Der Fed-vs.-EZB-Vergleich und das Eurozonen-BIP-Wachstum 1,2% beeinflussen die EU-Geldpolitikausrichtung.
-
-Eine ruhige Makro-Umgebung beseitigt nicht die Bitcoin-Quantenbedrohung, rahmt aber ein, wie Anleger zwischen traditionellen und digitalen Anlagen allokieren. Die folgende Grafik zeigt, wie Eurozonen-Inflation 1,9% und der EZB-Einlagenfazilitätssatz mit Risikoanlagen-Bedingungen zusammenspielen; dieselbe Linse gilt bei der Einschätzung, ob 2026 ein Quanten-„Deadline“ oder einfach ein Jahr in einem längeren Vorbereitungsfenster ist.
-
-![Eurozonen-Inflation 1,9% und EZB-Zinssätze 2026 Risikoanlagen-Kontext](/static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-quantum-chart.webp)
-
-*Datenquelle: CoinShares, 2026.*
-
-## Bitcoin-Quantenbedrohung: die Hardware-Lücke und warum 2030
-
-Bis Ende 2025 hatte „Quantenpanik“ einen Höhepunkt erreicht. Googles Willow-Chip zeigte exponentielle Fehlerreduktion auf 105 Qubits, Microsoft und Quantinuum demonstrierten Dutzende logische Qubits, und KI-gestützte Dekoder wie AlphaQubit verbesserten die Fehlerkorrektur. Vor diesem Hintergrund liegt die Frage nahe, ob 2026 das Jahr sein wird, in dem Quantencomputer endlich Bitcoins Kryptographie brechen.
-
-CoinMarketCaps vertiefte Analyse von KI-beschleunigtem Quantencomputing kommt zu einem anderen Schluss: fast sicher nicht. Die Lücke zwischen heutigen lauten Geräten und einer Bitcoin-knackenden Maschine wird noch in Größenordnungen gemessen, nicht in Quartals-Produktlaunches. Microsoft-Forscher schätzen, dass das Brechen von Bitcoins 256-Bit-Elliptischer-Kurve innerhalb eines Tages Tausende logische Qubits erfordern würde, die bei aktuellen Fehlerraten wiederum Millionen physische Qubits bedeuten. CoinShares ergänzt, dass ein Angreifer, um einen öffentlichen Schlüssel innerhalb eines Tages zu invertieren, etwa 13 Millionen physische Qubits bräuchte – rund 100.000-mal mehr als die derzeit größten Quantencomputer. Selbst wenn KI hilft, bessere Chips und Dekoder zu entwerfen, verlegen diese Zahlen die wirklich gefährlichen Maschinen weit über den Horizont 2026.
-
-Deshalb sprechen viele Experten, darunter Adam Back, von einem 20–40-Jahres-Fenster für kryptographisch relevante Quantenbedrohungen, nicht von einem Ein- oder Zwei-Jahres-Countdown. Der realistischer Wendepunkt für Bitcoin sind die frühen 2030er, wenn Million-Qubit-Systeme plausibel werden und Post-Quanten-Kryptographie Zeit hatte zu reifen. Die folgende Abbildung veranschaulicht den 2026-vs.-2030-Zeitplan und wo die Bitcoin-P2PK-Verwundbarkeit in diesem Horizont steht.
-
-![Satoshi Nakamoto 1,1 Mio. BTC Quantenrisiko vs. 2030-Zeitplanszenario](/static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-scenario.webp)
-
-*Datenquelle: CoinShares, 2026.*
-
-## Zwei Szenarien: 2026-Panik vs. 2030er-Vorbereitung
-
-In einem pessimistischen Szenario preist der Markt weiterhin „Quanten 2026“-Schlagzeilen ein, ohne zwischen Demo-Hardware und kryptographisch relevanten Maschinen zu unterscheiden. Das könnte zu unnötiger Volatilität und überstürzten Entscheidungen führen. In einem ausgewogeneren Szenario nutzen Anleger und Builder die 2020er als Jahrzehnt des Designs und der Probe: Post-Quanten-Signaturschemata bauen und testen, Migrations-Piloten durchführen und Legacy-UTXOs aufräumen. Wenn diese Arbeit getan ist, wird das Eintreffen leistungsstarker Quanten-Hardware in den 2030ern eine herausfordernde Übergangsphase sein – keine unkontrollierbare Krise.
-
-Für langfristige Bitcoin-Halter ist der Zeitplan sowohl Warnung als auch Chance. Es ist eine Warnung, Quanten nicht völlig zu ignorieren, weil die 2030er schneller kommen werden als viele erwarten. Es ist auch eine Chance, EZB-Zinssätze 2026 und Eurozonen-Inflation 1,9% als Teil derselben Disziplin zu behandeln: Fokus auf Daten, nicht auf Hype. Das Satoshi-1M-BTC-Narrativ und die Bitcoin-P2PK-Verwundbarkeit erinnern an Vorbereitung; sie sind kein Grund zur Panik in 2026.
-
-## EU-Geldpolitikausblick 2026 und Fazit
-
-Im kommenden Jahr wird die EZB den Einlagenfazilitätssatz voraussichtlich bei etwa 2,00% halten und Eurozonen-Inflation 1,9% sowie Wachstum beobachten. Die EU-Geldpolitikausrichtung bleibt datenabhängig. Für Anleger, die sowohl Euro-Anlagen als auch Bitcoin halten, sollte dieselbe Disziplin wie bei EZB-Zinssätzen 2026 und Eurozonen-Inflation 1,9% auf die Bitcoin-Quantenbedrohung angewendet werden.
-
-Quanten-Zeitpläne deuten darauf hin, dass 2030 wichtiger ist als 2026; die Bitcoin-P2PK-Verwundbarkeit und das Satoshi-1M-BTC-Narrativ erinnern daran, die 2020er zur Vorbereitung zu nutzen. EZB-Zinssätze 2026 verankern die Makro-Geschichte; der 2030-Zeitplan verankert den technologischen Risikohorizont. Eine Sicht, die beides berücksichtigt, stellt sicher, dass Allokationsentscheidungen auf Evidenz statt auf Schlagzeilen basieren.
-"""
-write_mdx(BASE / "de" / "bitcoin-quantum-timeline-2030-vs-2026.mdx", de_timeline)
-
-# --- NL timeline ---
-nl_timeline = r"""---
-title: 'ECB 2026 en Bitcoin-kwantumtijdlijn: waarom 2030 belangrijker is'
-date: 2026-02-19
-summary: 'ECB-rentetarieven 2026 en eurozone-inflatie 1,9% bepalen het macro-kader. Bitcoin-kwantumbedreiging: jaren 2030 waarschijnlijker dan 2026-crisis.'
-tags:
-  - Bitcoin
-  - Kwantumcomputing
-  - "2030"
-  - Cryptobeveiliging
-authors:
-  - default
-layout: PostLayout
-images:
-  - /static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-hero.webp
-keywords:
-  - ECB interest rates 2026
-  - eurozone inflation 1.9%
-  - Bitcoin quantum threat
-  - Satoshi 1M BTC
-  - EZB Zinssätze 2026
----
-
-ECB-rentetarieven 2026 en eurozone-inflatie van 1,9% bepalen het macro-kader waartegen Bitcoin wordt gehouden. Met de depositofaciliteitrente op 2,00% en het EU-geldbeleidsvooruitzicht data-afhankelijk, beïnvloeden de DAX 40-voorspelling en het risicosentiment de allocatie. De **Bitcoin-kwantumbedreiging** heeft velen de vraag doen stellen of 2026 het jaar wordt waarin kwantum Bitcoin breekt. CoinMarketCap en CoinShares concluderen dat Bitcoin-brekende machines veel waarschijnlijker een verhaal van de jaren 2030 zijn dan een 2026-crisis. Van het Satoshi 1M BTC-scenario tot de bredere Bitcoin P2PK-kwetsbaarheid legt dit artikel uit waarom 2030 belangrijker is dan 2026.
-
-## Eurozone-inflatie 1,9% en macro-context
-
-Het inflatiedoel van de ECB van 2% en de stafprognoses van eurozone-inflatie 1,9% zetten de toon. De ECB-depositorente 2,00% en de hoofdherfinancieringsoperaties vormen de rentecorridor. Wanneer ECB-rentetarieven 2026 stabiel zijn en eurozone-inflatie 1,9% op koers, ondersteunt het risicosentiment vaak Bitcoin. De Fed vs. ECB-vergelijking en de eurozone-bbp-groei 1,2% beïnvloeden het EU-geldbeleidsvooruitzicht.
-
-Een rustige macro-omgeving verwijdert de Bitcoin-kwantumbedreiging niet, maar bepaalt wel hoe beleggers alloceren tussen traditionele en digitale activa. De onderstaande grafiek toont hoe eurozone-inflatie 1,9% en de ECB-depositofaciliteitrente samenspelen met risicoactivacondities; dezelfde lens geldt bij het beoordelen of 2026 een kwantum-„deadline“ is of simpelweg één jaar in een langer voorbereidingsvenster.
-
-![Eurozone-inflatie 1,9% en ECB-rentetarieven 2026 risicoactivacontext](/static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-quantum-chart.webp)
-
-*Bron: CoinShares, 2026.*
-
-## Bitcoin-kwantumbedreiging: de hardwarekloof en waarom 2030
-
-Eind 2025 had „kwantumpaniek“ een hoogtepunt bereikt. Google’s Willow-chip toonde exponentiële foutreductie op 105 qubits, Microsoft en Quantinuum demonstreerden tientallen logische qubits, en AI-gedreven decoders zoals AlphaQubit verbeterden de foutcorrectie. Tegen die achtergrond is het logisch te vragen of 2026 het jaar wordt waarin kwantumcomputers eindelijk de cryptografie van Bitcoin breken.
-
-CoinMarketCap’s diepgaande analyse van AI-versneld kwantumcomputing komt tot een heel andere conclusie: vrijwel zeker niet. De kloof tussen de huidige ruwe apparaten en een Bitcoin-brekende machine wordt nog gemeten in grootte-ordes, niet in kwartaalproductlanceringen. Microsoft-onderzoekers schatten dat het breken van Bitcoin’s 256-bit elliptische curve binnen een dag duizenden logische qubits zou vereisen, wat bij huidige foutpercentages weer vertaalt naar miljoenen fysieke qubits. CoinShares voegt toe dat een aanvaller om een publieke sleutel binnen één dag te inverseren ongeveer 13 miljoen fysieke qubits nodig zou hebben – ruwweg 100.000 keer meer dan de grootste huidige kwantumcomputers. Zelfs met AI die helpt betere chips en decoders te ontwerpen, plaatsen die aantallen de echt gevaarlijke machines ver voorbij de horizon 2026.
-
-Daarom spreken veel deskundigen, waaronder Adam Back, over een 20–40 jaar venster voor cryptografisch relevante kwantumbedreigingen, niet over een aftelling van één of twee jaar. Het realistischer kantelpunt voor Bitcoin zijn de vroege jaren 2030, wanneer miljoen-qubit-systemen plausibel beginnen te worden en post-kwantumcryptografie de tijd heeft gehad te rijpen. De onderstaande figuur illustreert de 2026 vs. 2030-tijdlijn en waar de Bitcoin P2PK-kwetsbaarheid in die horizon zit.
-
-![Satoshi Nakamoto 1,1M BTC kwantumrisico vs. 2030-tijdlijnscenario](/static/images/blog/bitcoin-quantum-timeline-2030-vs-2026-scenario.webp)
-
-*Bron: CoinShares, 2026.*
-
-## Twee scenario’s: 2026-paniek vs. jaren 2030-voorbereiding
-
-In een pessimistisch scenario blijft de markt „kwantum 2026“-koppen inprijzen zonder onderscheid te maken tussen demo-hardware en cryptografisch relevante machines. Dat zou kunnen leiden tot onnodige volatiliteit en overhaaste beslissingen. In een evenwichtiger scenario gebruiken beleggers en builders de jaren 2020 als ontwerp- en repetitiedecennium: post-kwantumsignatuurschema’s bouwen en testen, migratiepiloten draaien en legacy-UTXO’s opruimen. Als dat werk is gedaan, zal de komst van krachtige kwantumhardware in de jaren 2030 een uitdagende overgang zijn – geen onbeheersbare crisis.
-
-Voor langetermijn-Bitcoin-houders is de tijdlijn zowel een waarschuwing als een kans. Het is een waarschuwing om kwantum niet helemaal te negeren, omdat de jaren 2030 sneller zullen komen dan mensen verwachten. Het is ook een kans om ECB-rentetarieven 2026 en eurozone-inflatie 1,9% als onderdeel van dezelfde discipline te behandelen: focus op data, niet op hype. Het Satoshi 1M BTC-verhaal en de Bitcoin P2PK-kwetsbaarheid zijn herinneringen om voor te bereiden; zij zijn geen reden om in paniek te raken in 2026.
-
-## EU-geldbeleidsvooruitzicht 2026 en conclusie
-
-Het komende jaar zal de ECB de depositofaciliteitrente naar verwachting nabij 2,00% houden terwijl eurozone-inflatie 1,9% en groei worden gemonitord. Het EU-geldbeleidsvooruitzicht blijft data-afhankelijk. Voor beleggers die zowel euro-activa als Bitcoin houden, moet dezelfde discipline die op ECB-rentetarieven 2026 en eurozone-inflatie 1,9% wordt toegepast ook op de Bitcoin-kwantumbedreiging van toepassing zijn.
-
-Kwantumtijdlijnen suggereren dat 2030 belangrijker is dan 2026; de Bitcoin P2PK-kwetsbaarheid en het Satoshi 1M BTC-verhaal zijn herinneringen om de jaren 2020 te gebruiken om voor te bereiden. ECB-rentetarieven 2026 verankeren het macroverhaal; de 2030-tijdlijn verankert de technologische risicohorizon. Een beeld dat beide respecteert, zorgt ervoor dat allocatiebeslissingen op bewijs zijn gebaseerd in plaats van op koppen.
-"""
-write_mdx(BASE / "nl" / "bitcoin-quantum-timeline-2030-vs-2026.mdx", nl_timeline)
-
-# --- DE attack-scenarios ---
-de_attack = r"""---
-title: 'EZB 2026 und Bitcoin-Quanten-Angriffsszenarien'
-date: 2026-02-19
-summary: 'EZB-Zinssätze 2026 und Eurozonen-Inflation 1,9% setzen den Makro-Rahmen. Bitcoin-Quantenbedrohung: realistische Szenarien – gezielte UTXOs, kein sofortiger Ausverkauf.'
-tags:
-  - Bitcoin
-  - Quantencomputing
-  - Angriffsszenarien
-  - Marktauswirkung
-authors:
-  - default
-layout: PostLayout
-images:
-  - /static/images/blog/bitcoin-quantum-attack-scenarios-hero.webp
-keywords:
-  - ECB interest rates 2026
-  - eurozone inflation 1.9%
-  - Bitcoin quantum threat
-  - Satoshi 1M BTC
-  - EZB Zinssätze 2026
----
-
-Die EZB-Zinssätze 2026 und die Eurozonen-Inflation von 1,9% definieren den Makro-Rahmen, vor dem Bitcoin gehalten und bewertet wird. Bei einem Einlagenfazilitätssatz von 2,00% und datenabhängiger EU-Geldpolitik beeinflussen DAX-40-Prognose und Risikosentiment die Allokation. Gleichzeitig wird die **Bitcoin-Quantenbedrohung** oft als ein einziges Apokalypse-Ereignis dargestellt. In der Realität würden Quantenangriffe auf bestimmte UTXOs und Mempool-Fenster zielen, nicht das Netzwerk sofort auslöschen. Vom Satoshi-1M-BTC-Szenario bis zur breiteren Bitcoin-P2PK-Verwundbarkeit zeigen realistische Szenarien begrenzte, absorbierbare Schocks. Dieser Artikel setzt den Makro-Kontext (EZB-Zinssätze 2026, Eurozonen-Inflation 1,9%) und skizziert dann, wie ein Quantenangriff auf Bitcoin tatsächlich aussehen würde.
-
-## Eurozonen-Inflation 1,9% und Makro-Kontext
-
-Das Inflationsziel der EZB von 2% und die Stabsprojektionen der Eurozonen-Inflation von 1,9% setzen den Ton für die Finanzbedingungen. Der EZB-Einlagensatz 2,00% und die Hauptrefinanzierungsgeschäfte bilden den Zinskorridor. Wenn die EZB-Zinssätze 2026 stabil sind und die Eurozonen-Inflation 1,9% auf Kurs, stützt das Risikosentiment oft Bitcoin. Der Fed-vs.-EZB-Vergleich und das Eurozonen-BIP-Wachstum 1,2% beeinflussen die EU-Geldpolitikausrichtung. Für Angriffsszenarien ist der Makro-Kontext relevant, weil er beeinflusst, wie Märkte einen quantenbezogenen Schock absorbieren würden.
-
-EZB-Zinssätze 2026 und der Pfad der Eurozonen-Inflation 1,9% sind Teil der Umgebung, in der sich ein künftiger Angriff abspielen würde. Eine ruhige Makro-Lage beseitigt nicht die Bitcoin-Quantenbedrohung, beeinflusst aber, wie viel Liquidität und Risikoappetit vorhanden sind, um eine plötzliche Neubewertung zu absorbieren. Die folgende Grafik veranschaulicht, wie Eurozonen-Inflation 1,9% und der EZB-Einlagenfazilitätssatz mit dem Risikoanlagen-Sentiment zusammenspielen; derselbe Rahmen gilt bei der Einschätzung, wie Bitcoin auf ein gezieltes quantenbezogenes Ereignis reagieren könnte.
-
-![Eurozonen-Inflation 1,9% und EZB-Zinssätze 2026 Makro-Kontext für Risikoanlagen](/static/images/blog/bitcoin-quantum-attack-scenarios-quantum-chart.webp)
-
-*Datenquelle: CoinShares, 2026.*
-
-## Bitcoin-Quantenbedrohung: wo Angriffe ansetzen würden
-
-CoinShares betont, dass die unmittelbare Exposition auf Outputs beschränkt ist, bei denen öffentliche Schlüssel sichtbar sind: vor allem alte Pay-to-Public-Key-(P2PK-)Outputs und wiederverwendete Adressen. Binance ergänzt, dass diese Fläche bis 2026 eher theoretisch als ausbeutbar sei. Die **Bitcoin-P2PK-Verwundbarkeit** und die Schätzungen von 4 Mio. exponierten BTC (CoinShares-Quantenforschung) definieren die Zielmenge; das Satoshi-1M-BTC-Narrativ ist das dramatischste Beispiel.
-
-Es ist nützlich zu skizzieren, wie ein fähiger Angreifer sich verhalten könnte, wenn eine Bitcoin-knackende Quantenmaschine existierte. Das erste Szenario ist ein langsamer Tropfen: stilles Abziehen kleiner Beträge aus lange inaktiven P2PK-Adressen über Monate oder Jahre. Aus Sicht des Marktes würde das als zusätzlicher Verkaufsdruck erscheinen – unangenehm, aber vergleichbar mit großen Haltern, die schrittweise Gewinne realisieren. Ein dramatischeres Szenario würde berühmte, lange stille Adressen ins Visier nehmen, von denen angenommen wird, dass sie Satoshi oder anderen frühen Walen gehören. Sobald diese Coins sich bewegen, würden On-Chain-Analysten und soziale Medien explodieren und ein scharfer, temporärer Verkauf wäre wahrscheinlich. Ein solches Ereignis würde Bitcoin jedoch nicht automatisch zerstören; es würde eher eine heftige, aber absorbierbare Neubewertung auslösen.
-
-Das technisch beängstigendste Szenario ist Mempool-Sniping: einen privaten Schlüssel ableiten, während eine Transaktion auf die Bestätigung wartet, und dann den Ausgeber überholen. Das würde erfordern, Shors Algorithmus in Minuten laufen zu lassen, was weit jenseits jeder absehbaren Hardware liegt. Lange bevor das realistisch ist, wird Bitcoin voraussichtlich Post-Quanten-Signaturen übernommen haben. Die folgende Abbildung fasst diese Angriffsflächen und die relative Exposition von P2PK- vs. P2PKH-Outputs zusammen.
-
-![Bitcoin-Quantenbedrohung P2PK-Exposition und Angriffsfläche](/static/images/blog/bitcoin-quantum-attack-scenarios-scenario.webp)
-
-*Datenquelle: CoinShares, 2026.*
-
-## Während Untergangs-Schlagzeilen dominieren, deuten Daten auf begrenzte Auswirkung
-
-Während viele Kommentatoren nahelegen, ein Quantencomputer könne Bitcoin eines Tages „in einem Schlag leeren“, erzählen die Daten von CoinShares und Binance eine andere Geschichte. Die Angriffsfläche konzentriert sich auf Legacy-Outputs und wiederverwendete Adressen; die überwiegende Mehrheit der aktiv verwalteten Coins liegt in Pay-to-Public-Key-Hash- oder SegWit-Outputs, bei denen der öffentliche Schlüssel nur bei der Ausgabe erscheint. Das lässt für einen hypothetischen Angreifer nur ein schmales Mempool-Fenster – und die aktuelle Hardware kommt nicht annähernd an die Millionen physischer Qubits heran, die nötig wären, um es innerhalb eines Blockintervalls auszunutzen.
-
-Das populäre Narrativ ignoriert oft den Unterschied zwischen „theoretisch gefährdet“ und „praktisch angreifbar“. CoinShares-Quantenforschung und Schätzungen von 4 Mio. exponierten BTC schließen Adresswiederverwendung und einmalig offengelegte Schlüssel ein; nur ein Bruchteil davon liegt in großen, wertvollen UTXOs, die Märkte bewegen würden, wenn sie gestohlen würden. Für Anleger ist die Implikation klar: Die Bitcoin-Quantenbedrohung ist langfristig real, aber Panik ist kein Ersatz für Vorbereitung. Migration zu post-quantum-fähigen Outputs und bessere Adresshygiene reduzieren die Exposition ohne perfektes Timing.
-
-## EU-Geldpolitikausblick 2026 und Fazit
-
-Im kommenden Jahr wird die EZB den Einlagenfazilitätssatz voraussichtlich bei etwa 2,00% halten und Eurozonen-Inflation 1,9% sowie Wachstum beobachten. Die EU-Geldpolitikausrichtung bleibt datenabhängig. Für Anleger, die sowohl Euro-Anlagen als auch Bitcoin halten, sollte dieselbe Disziplin wie bei EZB-Zinssätzen 2026 und Eurozonen-Inflation 1,9% auf die Bitcoin-Quantenbedrohung angewendet werden.
-
-Realistische Angriffsszenarien sind gezielt und absorbierbar; die Bitcoin-P2PK-Verwundbarkeit und das Satoshi-1M-BTC-Narrativ erinnern daran, durch Migration und Post-Quanten-Bereitschaft vorzusorgen. EZB-Zinssätze 2026 verankern die Makro-Geschichte; realistische Angriffsszenarien verankern die Risikobewertung. Eine Sicht, die sowohl Makrobedingungen als auch technologisches Risiko berücksichtigt, ist die Grundlage für eine sinnvolle Allokation über traditionelle und digitale Anlagen.
+These four articles predate the PRD limits and do not pass validate_blog.py yet
+(body too short, among others). Their meta.yml sets `validate: warn`, so PRD
+errors are reported as warnings and the articles are still written, as they
+always were.
 """
-write_mdx(BASE / "de" / "bitcoin-quantum-attack-scenarios.mdx", de_attack)
-
-# --- NL attack-scenarios ---
-nl_attack = r"""---
-title: 'ECB 2026 en Bitcoin-kwantumaanvalscenario's'
-date: 2026-02-19
-summary: 'ECB-rentetarieven 2026 en eurozone-inflatie 1,9% bepalen het macro-kader. Bitcoin-kwantumbedreiging: realistische scenario's – gerichte UTXO's, geen instant uitwissing.'
-tags:
-  - Bitcoin
-  - Kwantumcomputing
-  - Aanvalscenario's
-  - Marktimpact
-authors:
-  - default
-layout: PostLayout
-images:
-  - /static/images/blog/bitcoin-quantum-attack-scenarios-hero.webp
-keywords:
-  - ECB interest rates 2026
-  - eurozone inflation 1.9%
-  - Bitcoin quantum threat
-  - Satoshi 1M BTC
-  - EZB Zinssätze 2026
----
-
-ECB-rentetarieven 2026 en eurozone-inflatie van 1,9% bepalen het macro-kader waartegen Bitcoin wordt gehouden en gewaardeerd. Met de depositofaciliteitrente op 2,00% en het EU-geldbeleidsvooruitzicht data-afhankelijk, beïnvloeden de DAX 40-voorspelling en het risicosentiment de allocatie. Tegelijk wordt de **Bitcoin-kwantumbedreiging** vaak voorgesteld als één doemsdaggebeurtenis. In werkelijkheid zouden kwantumaanvallen op specifieke UTXO’s en mempoolvensters gericht zijn, niet het netwerk in één klap uitwissen. Van het Satoshi 1M BTC-scenario tot de bredere Bitcoin P2PK-kwetsbaarheid tonen realistische scenario’s beperkte, opneembare schokken. Dit artikel zet de macro-context (ECB-rentetarieven 2026, eurozone-inflatie 1,9%) en schetst vervolgens hoe een kwantumaanval op Bitcoin er echt uit zou zien.
-
-## Eurozone-inflatie 1,9% en macro-context
-
-Het inflatiedoel van de ECB van 2% en de stafprognoses van eurozone-inflatie 1,9% zetten de toon voor de financiële condities. De ECB-depositorente 2,00% en de hoofdherfinancieringsoperaties vormen de rentecorridor. Wanneer ECB-rentetarieven 2026 stabiel zijn en eurozone-inflatie 1,9% op koers, ondersteunt het risicosentiment vaak Bitcoin. De Fed vs. ECB-vergelijking en de eurozone-bbp-groei 1,2% beïnvloeden het EU-geldbeleidsvooruitzicht. Voor aanvalscenario’s doet de macro-context ertoe omdat die beïnvloedt hoe markten een kwantumgerelateerde schok zouden opvangen.
-
-ECB-rentetarieven 2026 en het pad van eurozone-inflatie 1,9% maken deel uit van de omgeving waarin een toekomstige aanval zou plaatsvinden. Een rustige macro-achtergrond verwijdert de Bitcoin-kwantumbedreiging niet, maar beïnvloedt wel hoeveel liquiditeit en risico-appetijt er zijn om een plotselinge herprijzing op te vangen. De onderstaande grafiek illustreert hoe eurozone-inflatie 1,9% en de ECB-depositofaciliteitrente samenspelen met het risicoactivasentiment; hetzelfde kader geldt bij het beoordelen hoe Bitcoin zou kunnen reageren op een gericht kwantumgerelateerd evenement.
-
-![Eurozone-inflatie 1,9% en ECB-rentetarieven 2026 macro-context voor risicoactiva](/static/images/blog/bitcoin-quantum-attack-scenarios-quantum-chart.webp)
-
-*Bron: CoinShares, 2026.*
-
-## Bitcoin-kwantumbedreiging: waar aanvallen op gericht zouden zijn
 
-CoinShares benadrukt dat de directe blootstelling beperkt is tot outputs waar publieke sleutels zichtbaar zijn: vooral oude Pay-to-Public-Key (P2PK)-outputs en hergebruikte adressen. Binance voegt toe dat dat oppervlak tegen 2026 meer theoretisch dan exploiteerbaar is. De **Bitcoin P2PK-kwetsbaarheid** en de 4 miljoen BTC blootgestelde schattingen (CoinShares kwantumonderzoek) definiëren de doelset; het Satoshi 1M BTC-verhaal is het meest dramatische voorbeeld.
+import sys
 
-Het is nuttig te schetsen hoe een capabele aanvaller zou kunnen handelen als er een Bitcoin-brekende kwantummachine bestond. Het eerste scenario is een traag druppelen: stilletjes kleine bedragen aftappen van lang sluimerende P2PK-adressen over maanden of jaren. Vanuit marktperspectief zou dat zichtbaar worden als een bijkomende verkoopdruk – onaangenaam maar vergelijkbaar met grote houders die geleidelijk winst nemen. Een dramatischer scenario zou gericht zijn op beroemde, lang stille adressen waarvan wordt aangenomen dat ze van Satoshi of andere vroege walvissen zijn. Op het moment dat die coins bewegen, zouden on-chain analisten en sociale media ontploffen en een scherpe, tijdelijke verkoopgolf zou waarschijnlijk zijn. Toch zou zo’n gebeurtenis Bitcoin niet automatisch vernietigen; het zou eerder een gewelddadige maar opneembare herprijzing triggeren.
+from translations import main
 
-Het technisch engste scenario is mempool-sniping: een privésleutel afleiden terwijl een transactie wacht om gemined te worden, en dan de uitgever voorblijven. Dat zou vereisen dat het algoritme van Shor in minuten draait, wat ver voorbij alle hardware aan de horizon ligt. Lang voordat dat realistisch is, zal Bitcoin waarschijnlijk post-kwantumsignaturen hebben aangenomen. De onderstaande figuur vat deze aanvalsoppervlakken en de relatieve blootstelling van P2PK vs. P2PKH-outputs samen.
-
-![Bitcoin-kwantumbedreiging P2PK-blootstelling en aanvalsoppervlak](/static/images/blog/bitcoin-quantum-attack-scenarios-scenario.webp)
-
-*Bron: CoinShares, 2026.*
-
-## Terwijl doemsdagkoppen domineren, wijzen data op beperkte impact
-
-Terwijl veel commentatoren suggereren dat een kwantumcomputer Bitcoin op een dag in één klap zou kunnen „leegmaken“, vertellen de data van CoinShares en Binance een ander verhaal. Het aanvalsoppervlak is geconcentreerd in legacy-outputs en hergebruikte adressen; de overgrote meerderheid van actief beheerde coins zit in Pay-to-Public-Key-Hash- of SegWit-achtige outputs waar de publieke sleutel alleen bij uitgaven verschijnt. Dat laat een smal mempoolvenster voor een hypothetische aanvaller – en de huidige hardware is nergens in de buurt van de miljoenen fysieke qubits die nodig zijn om het binnen één blockinterval te exploiteren.
-
-Het populaire verhaal negeert vaak het onderscheid tussen „theoretisch risico“ en „praktisch targeteerbaar“. CoinShares kwantumonderzoek en schattingen van 4 miljoen BTC blootgesteld omvatten adreshergebruik en eenmalig onthulde sleutels; slechts een fractie daarvan zit in grote, hoogwaardige UTXO’s die markten zouden bewegen als ze werden gestolen. Voor beleggers is de implicatie duidelijk: de Bitcoin-kwantumbedreiging is op de lange termijn reëel, maar paniek is geen substituut voor voorbereiding. Migratie naar post-kwantum-klare outputs en betere adreshygiëne verminderen de blootstelling zonder perfecte timing te vereisen.
-
-## EU-geldbeleidsvooruitzicht 2026 en conclusie
-
-Het komende jaar zal de ECB de depositofaciliteitrente naar verwachting nabij 2,00% houden terwijl eurozone-inflatie 1,9% en groei worden gemonitord. Het EU-geldbeleidsvooruitzicht blijft data-afhankelijk. Voor beleggers die zowel euro-activa als Bitcoin houden, moet dezelfde discipline die op ECB-rentetarieven 2026 en eurozone-inflatie 1,9% wordt toegepast ook op de Bitcoin-kwantumbedreiging van toepassing zijn.
-
-Realistische aanvalscenario’s zijn gericht en opneembaar; de Bitcoin P2PK-kwetsbaarheid en het Satoshi 1M BTC-verhaal zijn herinneringen om voor te bereiden via migratie en post-kwantumgereedheid. ECB-rentetarieven 2026 verankeren het macroverhaal; realistische aanvalscenario’s verankeren de risicobeoordeling. Een beeld dat zowel macro-omstandigheden als technologisch risico respecteert, is de basis voor een verstandige allocatie over traditionele en digitale activa.
-"""
-write_mdx(BASE / "nl" / "bitcoin-quantum-attack-scenarios.mdx", nl_attack)
+SLUGS = ("bitcoin-quantum-timeline-2030-vs-2026", "bitcoin-quantum-attack-scenarios")
 
-print("Done: 4 files (DE/NL timeline + DE/NL attack-scenarios).")
+if __name__ == "__main__":
+    sys.exit(main(["--slug", ",".join(SLUGS), "--lang", "de,nl", *sys.argv[1:]]))